@@ -36,9 +36,11 @@ from .tidesdb import (
     finalize,
     raise_open_file_limit,
     compression_available,
+    choose_compression,
     CommitOp,
     COMPARATOR_FUNC,
     COMMIT_HOOK_FUNC,
+    TIDESDB_CAPI,
     TDB_SUCCESS,
     TDB_ERR_MEMORY,
     TDB_ERR_INVALID_ARGS,
@@ -87,9 +89,11 @@ __all__ = [
     "finalize",
     "raise_open_file_limit",
     "compression_available",
+    "choose_compression",
     "CommitOp",
     "COMPARATOR_FUNC",
     "COMMIT_HOOK_FUNC",
+    "TIDESDB_CAPI",
     "TDB_SUCCESS",
     "TDB_ERR_MEMORY",
     "TDB_ERR_INVALID_ARGS",
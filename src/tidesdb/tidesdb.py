@@ -22,6 +22,10 @@ from __future__ import annotations
 import ctypes
 import os
 import sys
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable
 from ctypes import (
     CFUNCTYPE,
     POINTER,
@@ -44,7 +48,22 @@ from typing import Iterator as TypingIterator
 
 
 def _load_library() -> ctypes.CDLL:
-    """Load the TidesDB shared library."""
+    """
+    Load the TidesDB shared library.
+
+    TIDESDB_LIBRARY_PATH, when set, names the exact library file to load.
+    Otherwise a copy bundled next to this module is preferred, followed by the
+    loader's default search and the usual install prefixes.
+    """
+    override = os.environ.get("TIDESDB_LIBRARY_PATH")
+    if override:
+        try:
+            return ctypes.CDLL(override)
+        except OSError as exc:
+            raise RuntimeError(
+                f"Could not load TidesDB library from TIDESDB_LIBRARY_PATH={override!r}: {exc}"
+            ) from exc
+
     if sys.platform == "win32":
         lib_names = ["tidesdb.dll", "libtidesdb.dll"]
     elif sys.platform == "darwin":
@@ -53,6 +72,7 @@ def _load_library() -> ctypes.CDLL:
         lib_names = ["libtidesdb.so", "libtidesdb.so.1"]
 
     search_paths = [
+        os.path.dirname(os.path.abspath(__file__)) + os.sep,
         "",
         "/usr/local/lib/",
         "/usr/lib/",
@@ -69,7 +89,8 @@ def _load_library() -> ctypes.CDLL:
 
     raise RuntimeError(
         "Could not load TidesDB library. "
-        "Please ensure libtidesdb is installed and in your library path. "
+        "Please ensure libtidesdb is installed and in your library path, "
+        "or set TIDESDB_LIBRARY_PATH to the library file. "
         "On Linux: /usr/local/lib or set LD_LIBRARY_PATH. "
         "On macOS: /usr/local/lib or /opt/homebrew/lib or set DYLD_LIBRARY_PATH. "
         "On Windows: ensure tidesdb.dll is in PATH or current directory."
@@ -148,6 +169,26 @@ class ObjStoreBackend(IntEnum):
     BACKEND_UNKNOWN = 99
 
 
+# Human-readable descriptions of the TDB_ERR_* codes, used by TidesDBError.from_code.
+_ERROR_MESSAGES = {
+    TDB_ERR_MEMORY: "memory allocation failed",
+    TDB_ERR_INVALID_ARGS: "invalid arguments",
+    TDB_ERR_NOT_FOUND: "not found",
+    TDB_ERR_IO: "I/O error",
+    TDB_ERR_CORRUPTION: "data corruption",
+    TDB_ERR_EXISTS: "already exists",
+    TDB_ERR_CONFLICT: "transaction conflict",
+    TDB_ERR_TOO_LARGE: "key or value too large",
+    TDB_ERR_MEMORY_LIMIT: "memory limit exceeded",
+    TDB_ERR_INVALID_DB: "invalid database handle",
+    TDB_ERR_UNKNOWN: "unknown error",
+    TDB_ERR_LOCKED: "database is locked",
+    TDB_ERR_READONLY: "database is read-only",
+    TDB_ERR_BUSY: "resource busy",
+    TDB_ERR_PRECONDITION: "precondition failed",
+}
+
+
 class TidesDBError(Exception):
     """Base exception for TidesDB errors."""
 
@@ -158,25 +199,7 @@ class TidesDBError(Exception):
     @classmethod
     def from_code(cls, code: int, context: str = "") -> TidesDBError:
         """Create exception from error code."""
-        error_messages = {
-            TDB_ERR_MEMORY: "memory allocation failed",
-            TDB_ERR_INVALID_ARGS: "invalid arguments",
-            TDB_ERR_NOT_FOUND: "not found",
-            TDB_ERR_IO: "I/O error",
-            TDB_ERR_CORRUPTION: "data corruption",
-            TDB_ERR_EXISTS: "already exists",
-            TDB_ERR_CONFLICT: "transaction conflict",
-            TDB_ERR_TOO_LARGE: "key or value too large",
-            TDB_ERR_MEMORY_LIMIT: "memory limit exceeded",
-            TDB_ERR_INVALID_DB: "invalid database handle",
-            TDB_ERR_UNKNOWN: "unknown error",
-            TDB_ERR_LOCKED: "database is locked",
-            TDB_ERR_READONLY: "database is read-only",
-            TDB_ERR_BUSY: "resource busy",
-            TDB_ERR_PRECONDITION: "precondition failed",
-        }
-
-        msg = error_messages.get(code, "unknown error")
+        msg = _ERROR_MESSAGES.get(code, "unknown error")
         if context:
             msg = f"{context}: {msg} (code: {code})"
         else:
@@ -436,12 +459,16 @@ _lib.tidesdb_txn_begin.restype = c_int
 _lib.tidesdb_txn_begin_with_isolation.argtypes = [c_void_p, c_int, POINTER(c_void_p)]
 _lib.tidesdb_txn_begin_with_isolation.restype = c_int
 
+# Key and value inputs are declared c_char_p so bytes are passed by pointer
+# without an intermediate copy; lengths are always passed explicitly, so
+# embedded NUL bytes are preserved. Other buffer types are adapted by
+# _as_c_buffer at the call site.
 _lib.tidesdb_txn_put.argtypes = [
     c_void_p,
     c_void_p,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
     c_int64,
 ]
@@ -450,17 +477,17 @@ _lib.tidesdb_txn_put.restype = c_int
 _lib.tidesdb_txn_get.argtypes = [
     c_void_p,
     c_void_p,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
     POINTER(POINTER(c_uint8)),
     POINTER(c_size_t),
 ]
 _lib.tidesdb_txn_get.restype = c_int
 
-_lib.tidesdb_txn_delete.argtypes = [c_void_p, c_void_p, POINTER(c_uint8), c_size_t]
+_lib.tidesdb_txn_delete.argtypes = [c_void_p, c_void_p, c_char_p, c_size_t]
 _lib.tidesdb_txn_delete.restype = c_int
 
-_lib.tidesdb_txn_single_delete.argtypes = [c_void_p, c_void_p, POINTER(c_uint8), c_size_t]
+_lib.tidesdb_txn_single_delete.argtypes = [c_void_p, c_void_p, c_char_p, c_size_t]
 _lib.tidesdb_txn_single_delete.restype = c_int
 
 _lib.tidesdb_txn_commit.argtypes = [c_void_p]
@@ -490,10 +517,10 @@ _lib.tidesdb_iter_seek_to_first.restype = c_int
 _lib.tidesdb_iter_seek_to_last.argtypes = [c_void_p]
 _lib.tidesdb_iter_seek_to_last.restype = c_int
 
-_lib.tidesdb_iter_seek.argtypes = [c_void_p, POINTER(c_uint8), c_size_t]
+_lib.tidesdb_iter_seek.argtypes = [c_void_p, c_char_p, c_size_t]
 _lib.tidesdb_iter_seek.restype = c_int
 
-_lib.tidesdb_iter_seek_for_prev.argtypes = [c_void_p, POINTER(c_uint8), c_size_t]
+_lib.tidesdb_iter_seek_for_prev.argtypes = [c_void_p, c_char_p, c_size_t]
 _lib.tidesdb_iter_seek_for_prev.restype = c_int
 
 _lib.tidesdb_iter_valid.argtypes = [c_void_p]
@@ -528,9 +555,9 @@ _lib.tidesdb_compact.restype = c_int
 
 _lib.tidesdb_compact_range.argtypes = [
     c_void_p,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
 ]
 _lib.tidesdb_compact_range.restype = c_int
@@ -576,9 +603,9 @@ _lib.tidesdb_is_compacting.restype = c_int
 
 _lib.tidesdb_range_cost.argtypes = [
     c_void_p,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
-    POINTER(c_uint8),
+    c_char_p,
     c_size_t,
     POINTER(c_double),
 ]
@@ -648,6 +675,68 @@ _lib.tidesdb_objstore_default_config.restype = _CObjStoreConfig
 _lib.tidesdb_objstore_fs_create.argtypes = [c_char_p]
 _lib.tidesdb_objstore_fs_create.restype = c_void_p
 
+# Entry points used on every database, transaction and iterator round trip,
+# bound once at import so the methods below skip the CDLL attribute lookup per
+# call.
+_tidesdb_close = _lib.tidesdb_close
+_tidesdb_create_column_family = _lib.tidesdb_create_column_family
+_tidesdb_drop_column_family = _lib.tidesdb_drop_column_family
+_tidesdb_get_column_family = _lib.tidesdb_get_column_family
+_tidesdb_list_column_families = _lib.tidesdb_list_column_families
+_tidesdb_txn_begin = _lib.tidesdb_txn_begin
+_tidesdb_txn_begin_with_isolation = _lib.tidesdb_txn_begin_with_isolation
+_tidesdb_get_cache_stats = _lib.tidesdb_get_cache_stats
+_tidesdb_get_stats = _lib.tidesdb_get_stats
+_tidesdb_free_stats = _lib.tidesdb_free_stats
+_tidesdb_get_db_stats = _lib.tidesdb_get_db_stats
+_tidesdb_txn_put = _lib.tidesdb_txn_put
+_tidesdb_txn_get = _lib.tidesdb_txn_get
+_tidesdb_txn_delete = _lib.tidesdb_txn_delete
+_tidesdb_txn_single_delete = _lib.tidesdb_txn_single_delete
+_tidesdb_txn_commit = _lib.tidesdb_txn_commit
+_tidesdb_txn_rollback = _lib.tidesdb_txn_rollback
+_tidesdb_iter_new = _lib.tidesdb_iter_new
+_tidesdb_iter_seek_to_first = _lib.tidesdb_iter_seek_to_first
+_tidesdb_iter_seek = _lib.tidesdb_iter_seek
+_tidesdb_iter_seek_for_prev = _lib.tidesdb_iter_seek_for_prev
+_tidesdb_iter_valid = _lib.tidesdb_iter_valid
+_tidesdb_iter_next = _lib.tidesdb_iter_next
+_tidesdb_iter_prev = _lib.tidesdb_iter_prev
+_tidesdb_iter_key = _lib.tidesdb_iter_key
+_tidesdb_iter_value = _lib.tidesdb_iter_value
+_tidesdb_iter_key_value = _lib.tidesdb_iter_key_value
+_tidesdb_free = _lib.tidesdb_free
+
+
+def _symbol_address(name: str) -> int:
+    """Return the address of a library symbol, failing loudly if it is NULL."""
+    address = ctypes.cast(getattr(_lib, name), c_void_p).value
+    if address is None:
+        raise RuntimeError(f"libtidesdb symbol {name} resolved to NULL")
+    return address
+
+
+# Raw addresses of the data-path entry points, for callers that drive the C API
+# from compiled code (e.g. a numba @cfunc or a ctypes.CFUNCTYPE built from the
+# address) without going through these wrappers. Handles come from the
+# wrappers: Transaction._txn, ColumnFamily._cf and Iterator._iter. Signatures
+# are those in tidesdb.h.
+TIDESDB_CAPI: dict[str, int] = {
+    name: _symbol_address(name)
+    for name in (
+        "tidesdb_txn_put",
+        "tidesdb_txn_get",
+        "tidesdb_txn_delete",
+        "tidesdb_iter_valid",
+        "tidesdb_iter_next",
+        "tidesdb_iter_prev",
+        "tidesdb_iter_key",
+        "tidesdb_iter_value",
+        "tidesdb_iter_key_value",
+        "tidesdb_free",
+    )
+}
+
 
 @dataclass
 class ObjStoreConfig:
@@ -789,6 +878,37 @@ class ColumnFamilyConfig:
 
         return c_config
 
+    @classmethod
+    def _from_c_struct(cls, c_config: _CColumnFamilyConfig) -> ColumnFamilyConfig:
+        """Convert from C structure."""
+        return cls(
+            write_buffer_size=c_config.write_buffer_size,
+            level_size_ratio=c_config.level_size_ratio,
+            min_levels=c_config.min_levels,
+            dividing_level_offset=c_config.dividing_level_offset,
+            klog_value_threshold=c_config.klog_value_threshold,
+            compression_algorithm=CompressionAlgorithm(c_config.compression_algorithm),
+            enable_bloom_filter=bool(c_config.enable_bloom_filter),
+            bloom_fpr=c_config.bloom_fpr,
+            enable_block_indexes=bool(c_config.enable_block_indexes),
+            index_sample_ratio=c_config.index_sample_ratio,
+            block_index_prefix_len=c_config.block_index_prefix_len,
+            sync_mode=SyncMode(c_config.sync_mode),
+            sync_interval_us=c_config.sync_interval_us,
+            comparator_name=c_config.comparator_name.decode("utf-8"),
+            skip_list_max_level=c_config.skip_list_max_level,
+            skip_list_probability=c_config.skip_list_probability,
+            default_isolation_level=IsolationLevel(c_config.default_isolation_level),
+            min_disk_space=c_config.min_disk_space,
+            l1_file_count_trigger=c_config.l1_file_count_trigger,
+            l0_queue_stall_threshold=c_config.l0_queue_stall_threshold,
+            tombstone_density_trigger=c_config.tombstone_density_trigger,
+            tombstone_density_min_entries=c_config.tombstone_density_min_entries,
+            use_btree=bool(c_config.use_btree),
+            object_lazy_compaction=bool(c_config.object_lazy_compaction),
+            object_prefetch_compaction=bool(c_config.object_prefetch_compaction),
+        )
+
 
 @dataclass
 class Stats:
@@ -973,6 +1093,19 @@ def _encode_optional(value: str | None) -> bytes | None:
     return value.encode("utf-8") if value is not None else None
 
 
+# Prototypes for the optional S3 connector entry points, applied once when the
+# symbol is first resolved.
+_S3_PROTOTYPES = {
+    "tidesdb_objstore_s3_create": (
+        [c_char_p, c_char_p, c_char_p, c_char_p, c_char_p, c_char_p, c_int, c_int],
+        c_void_p,
+    ),
+    "tidesdb_objstore_s3_create_config": ([POINTER(_CS3Config)], c_void_p),
+}
+
+_s3_bound: dict[str, Callable] = {}
+
+
 def _bind_s3(symbol: str):
     """
     Resolve an S3 connector symbol lazily.
@@ -980,16 +1113,23 @@ def _bind_s3(symbol: str):
     The S3 backend is an optional, build-time feature (TIDESDB_WITH_S3=ON). When
     the library is built without it the symbol is absent, so it is resolved on
     first use rather than at import time -- otherwise importing this module would
-    fail on every non-S3 build.
+    fail on every non-S3 build. The resolved function is prototyped and cached so
+    later calls skip both the lookup and the argtypes setup.
     """
+    fn = _s3_bound.get(symbol)
+    if fn is not None:
+        return fn
     try:
-        return getattr(_lib, symbol)
+        fn = getattr(_lib, symbol)
     except AttributeError as exc:
         raise TidesDBError(
             "this build of the TidesDB library was compiled without S3 support "
             "(rebuild with -DTIDESDB_WITH_S3=ON)",
             TDB_ERR_INVALID_ARGS,
         ) from exc
+    fn.argtypes, fn.restype = _S3_PROTOTYPES[symbol]
+    _s3_bound[symbol] = fn
+    return fn
 
 
 def objstore_s3_create(
@@ -1026,17 +1166,6 @@ def objstore_s3_create(
         TidesDBError: If S3 support is not compiled in, or creation fails.
     """
     fn = _bind_s3("tidesdb_objstore_s3_create")
-    fn.argtypes = [
-        c_char_p,
-        c_char_p,
-        c_char_p,
-        c_char_p,
-        c_char_p,
-        c_char_p,
-        c_int,
-        c_int,
-    ]
-    fn.restype = c_void_p
     handle = fn(
         endpoint.encode("utf-8"),
         bucket.encode("utf-8"),
@@ -1097,8 +1226,6 @@ def objstore_s3_create_config(
         TidesDBError: If S3 support is not compiled in, or creation fails.
     """
     fn = _bind_s3("tidesdb_objstore_s3_create_config")
-    fn.argtypes = [POINTER(_CS3Config)]
-    fn.restype = c_void_p
 
     c_cfg = _CS3Config(
         endpoint=endpoint.encode("utf-8"),
@@ -1191,36 +1318,66 @@ def compression_available(algorithm: CompressionAlgorithm) -> bool:
     return bool(_lib.tidesdb_compression_available(int(algorithm)))
 
 
+_COMPRESSION_PREFERENCES = {
+    # Lowest CPU cost per byte first.
+    "fastest": (
+        CompressionAlgorithm.LZ4_FAST_COMPRESSION,
+        CompressionAlgorithm.LZ4_COMPRESSION,
+        CompressionAlgorithm.SNAPPY_COMPRESSION,
+    ),
+    # Good ratio at near-LZ4 throughput.
+    "balanced": (
+        CompressionAlgorithm.LZ4_COMPRESSION,
+        CompressionAlgorithm.ZSTD_COMPRESSION,
+        CompressionAlgorithm.SNAPPY_COMPRESSION,
+    ),
+    # Smallest on-disk footprint, at a higher compress/decompress cost.
+    "ratio": (
+        CompressionAlgorithm.ZSTD_COMPRESSION,
+        CompressionAlgorithm.LZ4_COMPRESSION,
+        CompressionAlgorithm.SNAPPY_COMPRESSION,
+    ),
+}
+
+
+def choose_compression(target: str = "balanced") -> CompressionAlgorithm:
+    """
+    Pick the preferred compression algorithm available in this build.
+
+    Targets:
+        "fastest": minimise CPU per block (LZ4_FAST, then LZ4, then SNAPPY).
+        "balanced": LZ4 for throughput with a reasonable ratio, then ZSTD.
+        "ratio": ZSTD for the smallest SSTables, then LZ4.
+
+    Candidates the library was built without are skipped; NO_COMPRESSION is
+    returned if none of them are available.
+
+    Args:
+        target: One of "fastest", "balanced" or "ratio".
+
+    Returns:
+        The CompressionAlgorithm to set on ColumnFamilyConfig.
+
+    Raises:
+        ValueError: If target is not a known target.
+    """
+    try:
+        candidates = _COMPRESSION_PREFERENCES[target]
+    except KeyError:
+        raise ValueError(
+            f"unknown compression target {target!r}; "
+            f"expected one of {sorted(_COMPRESSION_PREFERENCES)}"
+        ) from None
+    for algorithm in candidates:
+        if compression_available(algorithm):
+            return algorithm
+    return CompressionAlgorithm.NO_COMPRESSION
+
+
 def default_column_family_config() -> ColumnFamilyConfig:
     """Get default column family configuration from C library."""
     c_config = _lib.tidesdb_default_column_family_config()
-    return ColumnFamilyConfig(
-        write_buffer_size=c_config.write_buffer_size,
-        level_size_ratio=c_config.level_size_ratio,
-        min_levels=c_config.min_levels,
-        dividing_level_offset=c_config.dividing_level_offset,
-        klog_value_threshold=c_config.klog_value_threshold,
-        compression_algorithm=CompressionAlgorithm(c_config.compression_algorithm),
-        enable_bloom_filter=bool(c_config.enable_bloom_filter),
-        bloom_fpr=c_config.bloom_fpr,
-        enable_block_indexes=bool(c_config.enable_block_indexes),
-        index_sample_ratio=c_config.index_sample_ratio,
-        block_index_prefix_len=c_config.block_index_prefix_len,
-        sync_mode=SyncMode(c_config.sync_mode),
-        sync_interval_us=c_config.sync_interval_us,
-        comparator_name=c_config.comparator_name.decode("utf-8").rstrip("\x00"),
-        skip_list_max_level=c_config.skip_list_max_level,
-        skip_list_probability=c_config.skip_list_probability,
-        default_isolation_level=IsolationLevel(c_config.default_isolation_level),
-        min_disk_space=c_config.min_disk_space,
-        l1_file_count_trigger=c_config.l1_file_count_trigger,
-        l0_queue_stall_threshold=c_config.l0_queue_stall_threshold,
-        tombstone_density_trigger=c_config.tombstone_density_trigger,
-        tombstone_density_min_entries=c_config.tombstone_density_min_entries,
-        use_btree=bool(c_config.use_btree),
-        object_lazy_compaction=bool(c_config.object_lazy_compaction),
-        object_prefetch_compaction=bool(c_config.object_prefetch_compaction),
-    )
+    return ColumnFamilyConfig._from_c_struct(c_config)
 
 
 def save_config_to_ini(file_path: str, cf_name: str, config: ColumnFamilyConfig) -> None:
@@ -1258,47 +1415,69 @@ def load_config_from_ini(file_path: str, cf_name: str) -> ColumnFamilyConfig:
     if result != TDB_SUCCESS:
         raise TidesDBError.from_code(result, "failed to load config from INI file")
 
-    return ColumnFamilyConfig(
-        write_buffer_size=c_config.write_buffer_size,
-        level_size_ratio=c_config.level_size_ratio,
-        min_levels=c_config.min_levels,
-        dividing_level_offset=c_config.dividing_level_offset,
-        klog_value_threshold=c_config.klog_value_threshold,
-        compression_algorithm=CompressionAlgorithm(c_config.compression_algorithm),
-        enable_bloom_filter=bool(c_config.enable_bloom_filter),
-        bloom_fpr=c_config.bloom_fpr,
-        enable_block_indexes=bool(c_config.enable_block_indexes),
-        index_sample_ratio=c_config.index_sample_ratio,
-        block_index_prefix_len=c_config.block_index_prefix_len,
-        sync_mode=SyncMode(c_config.sync_mode),
-        sync_interval_us=c_config.sync_interval_us,
-        comparator_name=c_config.comparator_name.decode("utf-8").rstrip("\x00"),
-        skip_list_max_level=c_config.skip_list_max_level,
-        skip_list_probability=c_config.skip_list_probability,
-        default_isolation_level=IsolationLevel(c_config.default_isolation_level),
-        min_disk_space=c_config.min_disk_space,
-        l1_file_count_trigger=c_config.l1_file_count_trigger,
-        l0_queue_stall_threshold=c_config.l0_queue_stall_threshold,
-        tombstone_density_trigger=c_config.tombstone_density_trigger,
-        tombstone_density_min_entries=c_config.tombstone_density_min_entries,
-        use_btree=bool(c_config.use_btree),
-        object_lazy_compaction=bool(c_config.object_lazy_compaction),
-        object_prefetch_compaction=bool(c_config.object_prefetch_compaction),
-    )
+    return ColumnFamilyConfig._from_c_struct(c_config)
+
+
+def _as_c_buffer(data: bytes | bytearray | memoryview) -> bytes | ctypes.Array[c_char]:
+    """
+    Adapt a key or value for a c_char_p argument.
+
+    bytes are returned unchanged and passed by pointer. c_char_p accepts only
+    bytes and c_char arrays, so other writable contiguous buffers are wrapped in
+    place without copying, and read-only or strided ones are copied.
+    """
+    if type(data) is bytes:
+        return data
+    view = memoryview(data)
+    if view.readonly or not view.c_contiguous:
+        return view.tobytes()
+    return (c_char * view.nbytes).from_buffer(view)
+
+
+def _view_at(ptr: ctypes._Pointer, size: int) -> memoryview:
+    """Return a read-only memoryview over size bytes at ptr without copying."""
+    if not size:
+        return memoryview(b"")
+    buf = (c_uint8 * size).from_address(ctypes.addressof(ptr.contents))
+    return memoryview(buf).cast("B").toreadonly()
 
 
 class Iterator:
     """Iterator for traversing key-value pairs in a column family."""
 
-    def __init__(self, iter_ptr: c_void_p) -> None:
+    __slots__ = (
+        "_iter",
+        "_closed",
+        "_key_ptr",
+        "_key_size",
+        "_value_ptr",
+        "_value_size",
+        "_key_out",
+        "_value_out",
+        "_finalizer",
+        "__weakref__",
+    )
+
+    def __init__(self, iter_ptr: int) -> None:
+        # Raw handle address; c_void_p argtypes accept a plain int.
         self._iter = iter_ptr
         self._closed = False
+        # Frees the native iterator if the object is collected without close().
+        self._finalizer = weakref.finalize(self, _lib.tidesdb_iter_free, iter_ptr)
+        # Out-parameters reused by every key/value read; the C side overwrites
+        # them on each call, so none are allocated per entry.
+        self._key_ptr = POINTER(c_uint8)()
+        self._key_size = c_size_t()
+        self._value_ptr = POINTER(c_uint8)()
+        self._value_size = c_size_t()
+        self._key_out = (ctypes.byref(self._key_ptr), ctypes.byref(self._key_size))
+        self._value_out = (ctypes.byref(self._value_ptr), ctypes.byref(self._value_size))
 
     def seek_to_first(self) -> None:
         """Position iterator at the first key."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
-        result = _lib.tidesdb_iter_seek_to_first(self._iter)
+        result = _tidesdb_iter_seek_to_first(self._iter)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to seek to first")
 
@@ -1310,21 +1489,21 @@ class Iterator:
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to seek to last")
 
-    def seek(self, key: bytes) -> None:
+    def seek(self, key: bytes | bytearray | memoryview) -> None:
         """Position iterator at the first key >= target key."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-        result = _lib.tidesdb_iter_seek(self._iter, key_buf, len(key))
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_iter_seek(self._iter, key_buf or None, len(key_buf))
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to seek")
 
-    def seek_for_prev(self, key: bytes) -> None:
+    def seek_for_prev(self, key: bytes | bytearray | memoryview) -> None:
         """Position iterator at the last key <= target key."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-        result = _lib.tidesdb_iter_seek_for_prev(self._iter, key_buf, len(key))
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_iter_seek_for_prev(self._iter, key_buf or None, len(key_buf))
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to seek for prev")
 
@@ -1332,81 +1511,211 @@ class Iterator:
         """Check if iterator is positioned at a valid entry."""
         if self._closed:
             return False
-        return bool(_lib.tidesdb_iter_valid(self._iter))
+        return bool(_tidesdb_iter_valid(self._iter))
 
     def next(self) -> None:
         """Move iterator to the next entry."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
         # next() returns NOT_FOUND when reaching the end, which is not an error
-        _lib.tidesdb_iter_next(self._iter)
+        _tidesdb_iter_next(self._iter)
 
     def prev(self) -> None:
         """Move iterator to the previous entry."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
         # prev() returns NOT_FOUND when reaching the beginning, which is not an error
-        _lib.tidesdb_iter_prev(self._iter)
+        _tidesdb_iter_prev(self._iter)
 
     def key(self) -> bytes:
         """Get the current key."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
 
-        key_ptr = POINTER(c_uint8)()
-        key_size = c_size_t()
-
-        result = _lib.tidesdb_iter_key(self._iter, ctypes.byref(key_ptr), ctypes.byref(key_size))
+        result = _tidesdb_iter_key(self._iter, *self._key_out)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get key")
 
-        return ctypes.string_at(key_ptr, key_size.value)
+        return ctypes.string_at(self._key_ptr, self._key_size.value)
 
     def value(self) -> bytes:
         """Get the current value."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
 
-        value_ptr = POINTER(c_uint8)()
-        value_size = c_size_t()
+        result = _tidesdb_iter_value(self._iter, *self._value_out)
+        if result != TDB_SUCCESS:
+            raise TidesDBError.from_code(result, "failed to get value")
 
-        result = _lib.tidesdb_iter_value(
-            self._iter, ctypes.byref(value_ptr), ctypes.byref(value_size)
-        )
+        return ctypes.string_at(self._value_ptr, self._value_size.value)
+
+    def key_view(self) -> memoryview:
+        """
+        Get a zero-copy view of the current key.
+
+        The view aliases the iterator's internal buffer and is only valid until the
+        iterator is moved, re-seeked or closed; copy it with bytes() to keep it.
+        """
+        if self._closed:
+            raise TidesDBError("Iterator is closed")
+
+        result = _tidesdb_iter_key(self._iter, *self._key_out)
+        if result != TDB_SUCCESS:
+            raise TidesDBError.from_code(result, "failed to get key")
+
+        return _view_at(self._key_ptr, self._key_size.value)
+
+    def value_view(self) -> memoryview:
+        """
+        Get a zero-copy view of the current value.
+
+        The view aliases the iterator's internal buffer and is only valid until the
+        iterator is moved, re-seeked or closed; copy it with bytes() to keep it.
+        """
+        if self._closed:
+            raise TidesDBError("Iterator is closed")
+
+        result = _tidesdb_iter_value(self._iter, *self._value_out)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get value")
 
-        return ctypes.string_at(value_ptr, value_size.value)
+        return _view_at(self._value_ptr, self._value_size.value)
 
     def key_value(self) -> tuple[bytes, bytes]:
         """Get the current key and value in a single call (more efficient than separate key()/value())."""
         if self._closed:
             raise TidesDBError("Iterator is closed")
 
-        key_ptr = POINTER(c_uint8)()
-        key_size = c_size_t()
-        value_ptr = POINTER(c_uint8)()
-        value_size = c_size_t()
-
-        result = _lib.tidesdb_iter_key_value(
-            self._iter,
-            ctypes.byref(key_ptr),
-            ctypes.byref(key_size),
-            ctypes.byref(value_ptr),
-            ctypes.byref(value_size),
-        )
+        result = _tidesdb_iter_key_value(self._iter, *self._key_out, *self._value_out)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get key-value")
 
         return (
-            ctypes.string_at(key_ptr, key_size.value),
-            ctypes.string_at(value_ptr, value_size.value),
+            ctypes.string_at(self._key_ptr, self._key_size.value),
+            ctypes.string_at(self._value_ptr, self._value_size.value),
         )
 
+    def collect(self, limit: int | None = None) -> list[tuple[bytes, bytes]]:
+        """
+        Read entries from the current position forward into a list.
+
+        Equivalent to list(self), but runs one loop with the library calls and
+        out-parameters bound once instead of going through __next__ per entry.
+
+        Args:
+            limit: Maximum number of entries to read, or None for all remaining
+
+        Returns:
+            List of (key, value) tuples; the iterator is left on the entry after
+            the last one read
+        """
+        return self._collect(_tidesdb_iter_next, limit)
+
+    def collect_reverse(self, limit: int | None = None) -> list[tuple[bytes, bytes]]:
+        """
+        Read entries from the current position backward into a list.
+
+        The reverse counterpart of collect(), typically used after seek_to_last()
+        or seek_for_prev().
+
+        Args:
+            limit: Maximum number of entries to read, or None for all remaining
+
+        Returns:
+            List of (key, value) tuples in descending key order; the iterator is
+            left on the entry before the last one read
+        """
+        return self._collect(_tidesdb_iter_prev, limit)
+
+    def collect_prefix(self, prefix: bytes, limit: int | None = None) -> list[tuple[bytes, bytes]]:
+        """
+        Read every entry whose key starts with prefix into a list.
+
+        Seeks to prefix and collects forward until the first key outside it.
+        Relies on keys sharing a prefix being contiguous, which holds for the
+        default bytewise ordering but not necessarily for custom comparators.
+        An empty prefix matches every key and reads from the first entry.
+
+        Args:
+            prefix: Key prefix as bytes
+            limit: Maximum number of entries to read, or None for all matching
+
+        Returns:
+            List of (key, value) tuples in ascending key order
+        """
+        if not prefix:
+            self.seek_to_first()
+            return self._collect(_tidesdb_iter_next, limit)
+        self.seek(prefix)
+        return self._collect(_tidesdb_iter_next, limit, prefix)
+
+    def count(self) -> int:
+        """
+        Count the entries from the current position to the end.
+
+        Only advances the iterator; keys and values are never copied out. The
+        iterator is exhausted afterwards.
+
+        Returns:
+            Number of entries stepped over
+        """
+        if self._closed:
+            raise TidesDBError("Iterator is closed")
+
+        iter_ptr = self._iter
+        valid = _tidesdb_iter_valid
+        advance = _tidesdb_iter_next
+
+        n = 0
+        while valid(iter_ptr):
+            advance(iter_ptr)
+            n += 1
+        return n
+
+    def _collect(
+        self,
+        advance: Callable[[int], int],
+        limit: int | None,
+        prefix: bytes | None = None,
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Read entries into a list, stepping with advance (next or prev) and
+        stopping early at the first key that does not start with prefix.
+        """
+        if self._closed:
+            raise TidesDBError("Iterator is closed")
+
+        iter_ptr = self._iter
+        valid = _tidesdb_iter_valid
+        key_value = _tidesdb_iter_key_value
+        string_at = ctypes.string_at
+
+        key_ptr = self._key_ptr
+        key_size = self._key_size
+        value_ptr = self._value_ptr
+        value_size = self._value_size
+        out = self._key_out + self._value_out
+
+        items: list[tuple[bytes, bytes]] = []
+        append = items.append
+        while (limit is None or len(items) < limit) and valid(iter_ptr):
+            result = key_value(iter_ptr, *out)
+            if result != TDB_SUCCESS:
+                raise TidesDBError.from_code(result, "failed to get key-value")
+            key = string_at(key_ptr, key_size.value)
+            if prefix is not None and not key.startswith(prefix):
+                break
+            append((key, string_at(value_ptr, value_size.value)))
+            advance(iter_ptr)
+
+        return items
+
     def close(self) -> None:
         """Free iterator resources."""
         if not self._closed and self._iter:
-            _lib.tidesdb_iter_free(self._iter)
+            # The finalizer may already have run (e.g. at interpreter exit).
+            if self._finalizer.alive:
+                self._finalizer()
             self._closed = True
 
     def __enter__(self) -> Iterator:
@@ -1420,16 +1729,76 @@ class Iterator:
         return self
 
     def __next__(self) -> tuple[bytes, bytes]:
-        if not self.valid():
+        if self._closed or not _tidesdb_iter_valid(self._iter):
             raise StopIteration
-        kv = self.key_value()
-        self.next()
+        result = _tidesdb_iter_key_value(self._iter, *self._key_out, *self._value_out)
+        if result != TDB_SUCCESS:
+            raise TidesDBError.from_code(result, "failed to get key-value")
+        kv = (
+            ctypes.string_at(self._key_ptr, self._key_size.value),
+            ctypes.string_at(self._value_ptr, self._value_size.value),
+        )
+        _tidesdb_iter_next(self._iter)
         return kv
 
-    def __del__(self) -> None:
-        if _lib is None:
-            return
-        self.close()
+
+def _stats_from_c(c_stats: _CStats) -> Stats:
+    """Convert a tidesdb_stats_t into Stats, copying every array it points to."""
+    # Slicing a ctypes pointer converts the whole per-level array in one call
+    # instead of one indexed field read per level.
+    n = max(c_stats.num_levels, 0)
+    sizes_ptr = c_stats.level_sizes
+    sstables_ptr = c_stats.level_num_sstables
+    keys_ptr = c_stats.level_key_counts
+    tombstones_ptr = c_stats.level_tombstone_counts
+
+    level_sizes: list[int] = sizes_ptr[:n] if sizes_ptr else []
+    level_num_sstables: list[int] = sstables_ptr[:n] if sstables_ptr else []
+    level_key_counts: list[int] = keys_ptr[:n] if keys_ptr else []
+    level_tombstone_counts: list[int] = tombstones_ptr[:n] if tombstones_ptr else []
+
+    config = None
+    if c_stats.config:
+        config = ColumnFamilyConfig._from_c_struct(c_stats.config.contents)
+
+    return Stats(
+        num_levels=c_stats.num_levels,
+        memtable_size=c_stats.memtable_size,
+        level_sizes=level_sizes,
+        level_num_sstables=level_num_sstables,
+        total_keys=c_stats.total_keys,
+        total_data_size=c_stats.total_data_size,
+        avg_key_size=c_stats.avg_key_size,
+        avg_value_size=c_stats.avg_value_size,
+        level_key_counts=level_key_counts,
+        read_amp=c_stats.read_amp,
+        hit_rate=c_stats.hit_rate,
+        use_btree=bool(c_stats.use_btree),
+        btree_total_nodes=c_stats.btree_total_nodes,
+        btree_max_height=c_stats.btree_max_height,
+        btree_avg_height=c_stats.btree_avg_height,
+        total_tombstones=c_stats.total_tombstones,
+        tombstone_ratio=c_stats.tombstone_ratio,
+        level_tombstone_counts=level_tombstone_counts,
+        max_sst_density=c_stats.max_sst_density,
+        max_sst_density_level=c_stats.max_sst_density_level,
+        wal_bytes_written=c_stats.wal_bytes_written,
+        flush_bytes_written=c_stats.flush_bytes_written,
+        compaction_bytes_written=c_stats.compaction_bytes_written,
+        compaction_bytes_read=c_stats.compaction_bytes_read,
+        user_bytes_written=c_stats.user_bytes_written,
+        flush_count=c_stats.flush_count,
+        compaction_count=c_stats.compaction_count,
+        config=config,
+    )
+
+
+# Seconds between polls when waiting on background work; the C API exposes
+# state flags and counters but no completion signal.
+_BACKGROUND_POLL_INTERVAL = 0.001
+
+# Default upper bound in seconds for flush_memtable(wait=True).
+_BACKGROUND_WAIT_TIMEOUT = 60.0
 
 
 class ColumnFamily:
@@ -1445,7 +1814,11 @@ class ColumnFamily:
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to compact column family")
 
-    def compact_range(self, start_key: bytes | None, end_key: bytes | None) -> None:
+    def compact_range(
+        self,
+        start_key: bytes | bytearray | memoryview | None,
+        end_key: bytes | bytearray | memoryview | None,
+    ) -> None:
         """
         Synchronously compact every SSTable whose key range overlaps
         [start_key, end_key).
@@ -1463,29 +1836,60 @@ class ColumnFamily:
                 TDB_ERR_LOCKED if another compaction is running, or other I/O
                 errors from the underlying merge.
         """
-        if start_key is None or len(start_key) == 0:
-            start_buf = None
-            start_len = 0
-        else:
-            start_buf = (c_uint8 * len(start_key)).from_buffer_copy(start_key)
-            start_len = len(start_key)
-
-        if end_key is None or len(end_key) == 0:
-            end_buf = None
-            end_len = 0
-        else:
-            end_buf = (c_uint8 * len(end_key)).from_buffer_copy(end_key)
-            end_len = len(end_key)
-
-        result = _lib.tidesdb_compact_range(self._cf, start_buf, start_len, end_buf, end_len)
+        start_buf = _as_c_buffer(start_key) if start_key else None
+        end_buf = _as_c_buffer(end_key) if end_key else None
+        result = _lib.tidesdb_compact_range(
+            self._cf,
+            start_buf,
+            len(start_buf) if start_buf else 0,
+            end_buf,
+            len(end_buf) if end_buf else 0,
+        )
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to compact range")
 
-    def flush_memtable(self) -> None:
-        """Manually trigger memtable flush for this column family."""
+    def flush_memtable(
+        self, wait: bool = False, timeout: float | None = _BACKGROUND_WAIT_TIMEOUT
+    ) -> None:
+        """
+        Manually trigger memtable flush for this column family.
+
+        With wait=True and a non-empty memtable, this blocks until the flush
+        count in get_stats() has advanced and no flush is in progress, so the
+        data has reached an SSTable when it returns.
+
+        Args:
+            wait: Block until the flush has completed
+            timeout: Maximum seconds to wait when wait is True (default 60;
+                None = no limit)
+
+        Raises:
+            TidesDBError: TDB_ERR_BUSY if the wait times out
+        """
+        before = self.get_stats() if wait else None
         result = _lib.tidesdb_flush_memtable(self._cf)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to flush memtable")
+        if before is None:
+            return
+        if before.memtable_size:
+            flushes = before.flush_count
+            self._wait_until(
+                lambda: not self.is_flushing() and self.get_stats().flush_count > flushes,
+                timeout,
+                "flush",
+            )
+        else:
+            self._wait_until(lambda: not self.is_flushing(), timeout, "flush")
+
+    @staticmethod
+    def _wait_until(done: Callable[[], bool], timeout: float | None, what: str) -> None:
+        """Poll done() until it returns True or timeout seconds pass."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TidesDBError(f"timed out waiting for {what}", TDB_ERR_BUSY)
+            time.sleep(_BACKGROUND_POLL_INTERVAL)
 
     def is_flushing(self) -> bool:
         """Check if a flush operation is in progress for this column family."""
@@ -1615,7 +2019,9 @@ class ColumnFamily:
         if hasattr(self, "_commit_hook_ref"):
             self._commit_hook_ref = None
 
-    def range_cost(self, key_a: bytes, key_b: bytes) -> float:
+    def range_cost(
+        self, key_a: bytes | bytearray | memoryview, key_b: bytes | bytearray | memoryview
+    ) -> float:
         """
         Estimate the computational cost of iterating between two keys.
 
@@ -1633,12 +2039,17 @@ class ColumnFamily:
         Raises:
             TidesDBError: If arguments are invalid (NULL pointers, zero-length keys)
         """
-        key_a_buf = (c_uint8 * len(key_a)).from_buffer_copy(key_a) if key_a else None
-        key_b_buf = (c_uint8 * len(key_b)).from_buffer_copy(key_b) if key_b else None
+        key_a_buf = _as_c_buffer(key_a)
+        key_b_buf = _as_c_buffer(key_b)
         cost = c_double()
 
         result = _lib.tidesdb_range_cost(
-            self._cf, key_a_buf, len(key_a), key_b_buf, len(key_b), ctypes.byref(cost)
+            self._cf,
+            key_a_buf or None,
+            len(key_a_buf),
+            key_b_buf or None,
+            len(key_b_buf),
+            ctypes.byref(cost),
         )
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to estimate range cost")
@@ -1648,114 +2059,73 @@ class ColumnFamily:
     def get_stats(self) -> Stats:
         """Get statistics for this column family."""
         stats_ptr = POINTER(_CStats)()
-        result = _lib.tidesdb_get_stats(self._cf, ctypes.byref(stats_ptr))
+        result = _tidesdb_get_stats(self._cf, stats_ptr)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get stats")
 
-        c_stats = stats_ptr.contents
-
-        level_sizes = []
-        level_num_sstables = []
-        level_key_counts = []
-        level_tombstone_counts: list[int] = []
-
-        if c_stats.num_levels > 0:
-            if c_stats.level_sizes:
-                for i in range(c_stats.num_levels):
-                    level_sizes.append(c_stats.level_sizes[i])
-            if c_stats.level_num_sstables:
-                for i in range(c_stats.num_levels):
-                    level_num_sstables.append(c_stats.level_num_sstables[i])
-            if c_stats.level_key_counts:
-                for i in range(c_stats.num_levels):
-                    level_key_counts.append(c_stats.level_key_counts[i])
-            if c_stats.level_tombstone_counts:
-                for i in range(c_stats.num_levels):
-                    level_tombstone_counts.append(c_stats.level_tombstone_counts[i])
-
-        config = None
-        if c_stats.config:
-            c_cfg = c_stats.config.contents
-            config = ColumnFamilyConfig(
-                write_buffer_size=c_cfg.write_buffer_size,
-                level_size_ratio=c_cfg.level_size_ratio,
-                min_levels=c_cfg.min_levels,
-                dividing_level_offset=c_cfg.dividing_level_offset,
-                klog_value_threshold=c_cfg.klog_value_threshold,
-                compression_algorithm=CompressionAlgorithm(c_cfg.compression_algorithm),
-                enable_bloom_filter=bool(c_cfg.enable_bloom_filter),
-                bloom_fpr=c_cfg.bloom_fpr,
-                enable_block_indexes=bool(c_cfg.enable_block_indexes),
-                index_sample_ratio=c_cfg.index_sample_ratio,
-                block_index_prefix_len=c_cfg.block_index_prefix_len,
-                sync_mode=SyncMode(c_cfg.sync_mode),
-                sync_interval_us=c_cfg.sync_interval_us,
-                comparator_name=c_cfg.comparator_name.decode("utf-8").rstrip("\x00"),
-                skip_list_max_level=c_cfg.skip_list_max_level,
-                skip_list_probability=c_cfg.skip_list_probability,
-                default_isolation_level=IsolationLevel(c_cfg.default_isolation_level),
-                min_disk_space=c_cfg.min_disk_space,
-                l1_file_count_trigger=c_cfg.l1_file_count_trigger,
-                l0_queue_stall_threshold=c_cfg.l0_queue_stall_threshold,
-                tombstone_density_trigger=c_cfg.tombstone_density_trigger,
-                tombstone_density_min_entries=c_cfg.tombstone_density_min_entries,
-                use_btree=bool(c_cfg.use_btree),
-                object_lazy_compaction=bool(c_cfg.object_lazy_compaction),
-                object_prefetch_compaction=bool(c_cfg.object_prefetch_compaction),
-            )
+        # The level arrays and config live in the C allocation, so everything is
+        # read out before it is released, even if conversion fails part way.
+        try:
+            return _stats_from_c(stats_ptr.contents)
+        finally:
+            _tidesdb_free_stats(stats_ptr)
+
+
+# Out-parameters for tidesdb_txn_get, one set per thread. The call runs without
+# the GIL, so a set shared by threads reading through the same transaction
+# could be overwritten mid-call.
+_txn_get_out = threading.local()
 
-        stats = Stats(
-            num_levels=c_stats.num_levels,
-            memtable_size=c_stats.memtable_size,
-            level_sizes=level_sizes,
-            level_num_sstables=level_num_sstables,
-            total_keys=c_stats.total_keys,
-            total_data_size=c_stats.total_data_size,
-            avg_key_size=c_stats.avg_key_size,
-            avg_value_size=c_stats.avg_value_size,
-            level_key_counts=level_key_counts,
-            read_amp=c_stats.read_amp,
-            hit_rate=c_stats.hit_rate,
-            use_btree=bool(c_stats.use_btree),
-            btree_total_nodes=c_stats.btree_total_nodes,
-            btree_max_height=c_stats.btree_max_height,
-            btree_avg_height=c_stats.btree_avg_height,
-            total_tombstones=c_stats.total_tombstones,
-            tombstone_ratio=c_stats.tombstone_ratio,
-            level_tombstone_counts=level_tombstone_counts,
-            max_sst_density=c_stats.max_sst_density,
-            max_sst_density_level=c_stats.max_sst_density_level,
-            wal_bytes_written=c_stats.wal_bytes_written,
-            flush_bytes_written=c_stats.flush_bytes_written,
-            compaction_bytes_written=c_stats.compaction_bytes_written,
-            compaction_bytes_read=c_stats.compaction_bytes_read,
-            user_bytes_written=c_stats.user_bytes_written,
-            flush_count=c_stats.flush_count,
-            compaction_count=c_stats.compaction_count,
-            config=config,
-        )
 
-        _lib.tidesdb_free_stats(stats_ptr)
-        return stats
+def _txn_get_out_params() -> tuple[ctypes._Pointer[c_uint8], c_size_t, tuple[object, object]]:
+    """Return this thread's (value_ptr, value_size, byref args) for tidesdb_txn_get."""
+    out = _txn_get_out
+    params: tuple[ctypes._Pointer[c_uint8], c_size_t, tuple[object, object]]
+    try:
+        params = out.params
+    except AttributeError:
+        value_ptr = POINTER(c_uint8)()
+        value_size = c_size_t()
+        params = (value_ptr, value_size, (ctypes.byref(value_ptr), ctypes.byref(value_size)))
+        out.params = params
+    return params
 
 
 class Transaction:
     """Transaction for atomic operations."""
 
-    def __init__(self, txn_ptr: c_void_p) -> None:
+    __slots__ = (
+        "_txn",
+        "_closed",
+        "_committed",
+        "_freed",
+        "_finalizer",
+        "__weakref__",
+    )
+
+    def __init__(self, txn_ptr: int) -> None:
+        # Raw handle address; c_void_p argtypes accept a plain int.
         self._txn = txn_ptr
         self._closed = False
         self._committed = False
         self._freed = False
+        # Frees the native transaction if the object is collected without close().
+        self._finalizer = weakref.finalize(self, _lib.tidesdb_txn_free, txn_ptr)
 
-    def put(self, cf: ColumnFamily, key: bytes, value: bytes, ttl: int = -1) -> None:
+    def put(
+        self,
+        cf: ColumnFamily,
+        key: bytes | bytearray | memoryview,
+        value: bytes | bytearray | memoryview,
+        ttl: int = -1,
+    ) -> None:
         """
         Put a key-value pair in the transaction.
 
         Args:
             cf: Column family handle
-            key: Key as bytes
-            value: Value as bytes
+            key: Key as bytes or another bytes-like buffer
+            value: Value as bytes or another bytes-like buffer
             ttl: Time-to-live as Unix timestamp (seconds since epoch), or -1 for no expiration
         """
         if self._closed:
@@ -1763,23 +2133,69 @@ class Transaction:
         if self._committed:
             raise TidesDBError("Transaction already committed")
 
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-        value_buf = (c_uint8 * len(value)).from_buffer_copy(value) if value else None
-
-        result = _lib.tidesdb_txn_put(
-            self._txn, cf._cf, key_buf, len(key), value_buf, len(value), ttl
+        key_buf = _as_c_buffer(key)
+        value_buf = _as_c_buffer(value)
+
+        result = _tidesdb_txn_put(
+            self._txn,
+            cf._cf,
+            key_buf or None,
+            len(key_buf),
+            value_buf or None,
+            len(value_buf),
+            ttl,
         )
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to put key-value pair")
 
-    def get(self, cf: ColumnFamily, key: bytes) -> bytes:
+    def put_many(
+        self,
+        cf: ColumnFamily,
+        items: Iterable[tuple[bytes | bytearray | memoryview, bytes | bytearray | memoryview]],
+        ttl: int = -1,
+    ) -> None:
+        """
+        Put many key-value pairs in the transaction.
+
+        Equivalent to calling put() for each pair, but the transaction state is
+        checked once and the handles are resolved once for the whole batch.
+
+        Args:
+            cf: Column family handle
+            items: Iterable of (key, value) pairs as bytes-like objects
+            ttl: Time-to-live applied to every pair, as in put()
+        """
+        if self._closed:
+            raise TidesDBError("Transaction is closed")
+        if self._committed:
+            raise TidesDBError("Transaction already committed")
+
+        txn_ptr = self._txn
+        cf_ptr = cf._cf
+        for key, value in items:
+            key_buf = _as_c_buffer(key)
+            value_buf = _as_c_buffer(value)
+            result = _tidesdb_txn_put(
+                txn_ptr,
+                cf_ptr,
+                key_buf or None,
+                len(key_buf),
+                value_buf or None,
+                len(value_buf),
+                ttl,
+            )
+
+            if result != TDB_SUCCESS:
+                raise TidesDBError.from_code(result, "failed to put key-value pair")
+
+    def get(self, cf: ColumnFamily, key: bytes | bytearray | memoryview) -> bytes:
         """
         Get a value from the transaction.
 
         Args:
             cf: Column family handle
-            key: Key as bytes
+            key: Key as bytes or another bytes-like buffer
 
         Returns:
             Value as bytes
@@ -1790,13 +2206,9 @@ class Transaction:
         if self._closed:
             raise TidesDBError("Transaction is closed")
 
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-        value_ptr = POINTER(c_uint8)()
-        value_size = c_size_t()
-
-        result = _lib.tidesdb_txn_get(
-            self._txn, cf._cf, key_buf, len(key), ctypes.byref(value_ptr), ctypes.byref(value_size)
-        )
+        value_ptr, value_size, value_out = _txn_get_out_params()
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_txn_get(self._txn, cf._cf, key_buf or None, len(key_buf), *value_out)
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get value")
@@ -1805,32 +2217,115 @@ class Transaction:
 
         # The value buffer is allocated by TidesDB's own allocator, so it must be
         # released through tidesdb_free rather than libc.free to stay correct when
-        # a custom allocator is configured.
-        _lib.tidesdb_free(ctypes.cast(value_ptr, c_void_p))
+        # a custom allocator is configured. The c_void_p argtype accepts the typed
+        # pointer directly, so no cast is needed.
+        _tidesdb_free(value_ptr)
 
         return value
 
-    def delete(self, cf: ColumnFamily, key: bytes) -> None:
+    def try_get(self, cf: ColumnFamily, key: bytes | bytearray | memoryview) -> bytes | None:
+        """
+        Get a value from the transaction, or None if the key does not exist.
+
+        Unlike get(), a missing key is not treated as an error, which avoids
+        raising and catching an exception on expected misses.
+
+        Args:
+            cf: Column family handle
+            key: Key as bytes or another bytes-like buffer
+
+        Returns:
+            Value as bytes, or None if the key is not found
+
+        Raises:
+            TidesDBError: On any error other than the key not being found
+        """
+        if self._closed:
+            raise TidesDBError("Transaction is closed")
+
+        value_ptr, value_size, value_out = _txn_get_out_params()
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_txn_get(self._txn, cf._cf, key_buf or None, len(key_buf), *value_out)
+
+        if result == TDB_ERR_NOT_FOUND:
+            return None
+        if result != TDB_SUCCESS:
+            raise TidesDBError.from_code(result, "failed to get value")
+
+        value = ctypes.string_at(value_ptr, value_size.value)
+        _tidesdb_free(value_ptr)
+
+        return value
+
+    def get_into(
+        self, cf: ColumnFamily, key: bytes | bytearray | memoryview, out: bytearray | memoryview
+    ) -> int:
+        """
+        Read a value into a caller-provided buffer instead of a new bytes object.
+
+        Lets read loops reuse one buffer rather than allocating per value.
+
+        Args:
+            cf: Column family handle
+            key: Key as bytes or another bytes-like buffer
+            out: Writable buffer that receives the value
+
+        Returns:
+            Number of bytes written to out
+
+        Raises:
+            TypeError: If out is a read-only buffer
+            TidesDBError: If key not found, out is too small for the value
+                (TDB_ERR_TOO_LARGE), or other error
+        """
+        if self._closed:
+            raise TidesDBError("Transaction is closed")
+        out_view = memoryview(out)
+        if out_view.readonly:
+            raise TypeError("get_into() requires a writable buffer, not a read-only one")
+
+        value_ptr, value_size, value_out = _txn_get_out_params()
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_txn_get(self._txn, cf._cf, key_buf or None, len(key_buf), *value_out)
+
+        if result != TDB_SUCCESS:
+            raise TidesDBError.from_code(result, "failed to get value")
+
+        try:
+            size = value_size.value
+            capacity = out_view.nbytes
+            if size > capacity:
+                raise TidesDBError(
+                    f"buffer too small for value ({capacity} < {size} bytes)",
+                    TDB_ERR_TOO_LARGE,
+                )
+            if size:
+                ctypes.memmove(ctypes.addressof(c_char.from_buffer(out)), value_ptr, size)
+        finally:
+            _tidesdb_free(value_ptr)
+
+        return size
+
+    def delete(self, cf: ColumnFamily, key: bytes | bytearray | memoryview) -> None:
         """
         Delete a key-value pair in the transaction.
 
         Args:
             cf: Column family handle
-            key: Key as bytes
+            key: Key as bytes or another bytes-like buffer
         """
         if self._closed:
             raise TidesDBError("Transaction is closed")
         if self._committed:
             raise TidesDBError("Transaction already committed")
 
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-
-        result = _lib.tidesdb_txn_delete(self._txn, cf._cf, key_buf, len(key))
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_txn_delete(self._txn, cf._cf, key_buf or None, len(key_buf))
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to delete key")
 
-    def single_delete(self, cf: ColumnFamily, key: bytes) -> None:
+    def single_delete(self, cf: ColumnFamily, key: bytes | bytearray | memoryview) -> None:
         """
         Write a tombstone carrying a caller-provided promise that the key has been
         put at most once since its previous single-delete (or since the start of
@@ -1846,16 +2341,15 @@ class Transaction:
 
         Args:
             cf: Column family handle
-            key: Key as bytes
+            key: Key as bytes or another bytes-like buffer
         """
         if self._closed:
             raise TidesDBError("Transaction is closed")
         if self._committed:
             raise TidesDBError("Transaction already committed")
 
-        key_buf = (c_uint8 * len(key)).from_buffer_copy(key) if key else None
-
-        result = _lib.tidesdb_txn_single_delete(self._txn, cf._cf, key_buf, len(key))
+        key_buf = _as_c_buffer(key)
+        result = _tidesdb_txn_single_delete(self._txn, cf._cf, key_buf or None, len(key_buf))
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to single-delete key")
@@ -1867,7 +2361,7 @@ class Transaction:
         if self._committed:
             raise TidesDBError("Transaction already committed")
 
-        result = _lib.tidesdb_txn_commit(self._txn)
+        result = _tidesdb_txn_commit(self._txn)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to commit transaction")
 
@@ -1880,7 +2374,7 @@ class Transaction:
         if self._committed:
             raise TidesDBError("Transaction already committed")
 
-        result = _lib.tidesdb_txn_rollback(self._txn)
+        result = _tidesdb_txn_rollback(self._txn)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to rollback transaction")
 
@@ -1953,16 +2447,21 @@ class Transaction:
             raise TidesDBError("Transaction is closed")
 
         iter_ptr = c_void_p()
-        result = _lib.tidesdb_iter_new(self._txn, cf._cf, ctypes.byref(iter_ptr))
+        result = _tidesdb_iter_new(self._txn, cf._cf, ctypes.byref(iter_ptr))
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to create iterator")
 
-        return Iterator(iter_ptr)
+        # A successful tidesdb_iter_new always stores a non-NULL handle.
+        iter_handle = iter_ptr.value
+        assert iter_handle is not None
+        return Iterator(iter_handle)
 
     def close(self) -> None:
         """Free transaction resources."""
         if not self._closed and self._txn:
-            _lib.tidesdb_txn_free(self._txn)
+            # The finalizer may already have run (e.g. at interpreter exit).
+            if self._finalizer.alive:
+                self._finalizer()
             self._closed = True
 
     def __enter__(self) -> Transaction:
@@ -1977,15 +2476,21 @@ class Transaction:
         self.close()
         return False
 
-    def __del__(self) -> None:
-        if _lib is None:
-            return
-        self.close()
-
 
 class TidesDB:
     """TidesDB database instance."""
 
+    __slots__ = (
+        "_db",
+        "_closed",
+        "_objstore_config_ref",
+        "_out_params",
+        "_path_bytes",
+        "_comparator_refs",
+        "_finalizer",
+        "__weakref__",
+    )
+
     def __init__(self, config: Config) -> None:
         """
         Open a TidesDB database.
@@ -1996,6 +2501,8 @@ class TidesDB:
         self._db: c_void_p | None = None
         self._closed = False
         self._objstore_config_ref: _CObjStoreConfig | None = None
+        # Per-thread out-parameter buffers reused across calls.
+        self._out_params = threading.local()
 
         os.makedirs(config.db_path, exist_ok=True)
         abs_path = os.path.abspath(config.db_path)
@@ -2036,13 +2543,18 @@ class TidesDB:
             finish_compactions_on_close=1 if config.finish_compactions_on_close else 0,
         )
 
+        # Arguments declared as POINTER(T) accept a T instance directly; ctypes
+        # passes it by reference without allocating a byref() wrapper.
         db_ptr = c_void_p()
-        result = _lib.tidesdb_open(ctypes.byref(c_config), ctypes.byref(db_ptr))
+        result = _lib.tidesdb_open(c_config, db_ptr)
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to open database")
 
         self._db = db_ptr
+        # Closes the native handle if the object is collected without close(); the
+        # finalizer holds only the raw pointer, so it does not keep self alive.
+        self._finalizer = weakref.finalize(self, _tidesdb_close, db_ptr)
 
     @classmethod
     def open(
@@ -2122,15 +2634,17 @@ class TidesDB:
 
     def close(self) -> None:
         """Close the database."""
-        if _lib is None:
-            return
         if not self._closed and self._db:
-            db_ptr = self._db
             self._db = None
             self._closed = True
-            result = _lib.tidesdb_close(db_ptr)
-            if result != TDB_SUCCESS:
-                raise TidesDBError.from_code(result, "failed to close database")
+            # detach() atomically takes over the close from the finalizer; it
+            # returns None if the finalizer already ran (e.g. at interpreter exit).
+            info = self._finalizer.detach()
+            if info is not None:
+                db_ptr = info[2][0]
+                result: int = _tidesdb_close(db_ptr)
+                if result != TDB_SUCCESS:
+                    raise TidesDBError.from_code(result, "failed to close database")
 
     def create_column_family(
         self, name: str, config: ColumnFamilyConfig | None = None
@@ -2150,9 +2664,7 @@ class TidesDB:
 
         c_config = config._to_c_struct(name)
 
-        result = _lib.tidesdb_create_column_family(
-            self._db, name.encode("utf-8"), ctypes.byref(c_config)
-        )
+        result = _tidesdb_create_column_family(self._db, name.encode("utf-8"), c_config)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to create column family")
 
@@ -2166,7 +2678,7 @@ class TidesDB:
         if self._closed:
             raise TidesDBError("Database is closed")
 
-        result = _lib.tidesdb_drop_column_family(self._db, name.encode("utf-8"))
+        result = _tidesdb_drop_column_family(self._db, name.encode("utf-8"))
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to drop column family")
 
@@ -2183,7 +2695,7 @@ class TidesDB:
         if self._closed:
             raise TidesDBError("Database is closed")
 
-        cf_ptr = _lib.tidesdb_get_column_family(self._db, name.encode("utf-8"))
+        cf_ptr = _tidesdb_get_column_family(self._db, name.encode("utf-8"))
         if not cf_ptr:
             raise TidesDBError(f"Column family not found: {name}", TDB_ERR_NOT_FOUND)
 
@@ -2199,12 +2711,13 @@ class TidesDB:
         if self._closed:
             raise TidesDBError("Database is closed")
 
-        names_ptr = POINTER(c_char_p)()
-        count = c_int()
+        out = self._out_params
+        try:
+            names_ptr, count = out.list_column_families
+        except AttributeError:
+            names_ptr, count = out.list_column_families = (POINTER(c_char_p)(), c_int())
 
-        result = _lib.tidesdb_list_column_families(
-            self._db, ctypes.byref(names_ptr), ctypes.byref(count)
-        )
+        result = _tidesdb_list_column_families(self._db, names_ptr, count)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to list column families")
 
@@ -2222,9 +2735,9 @@ class TidesDB:
             if str_ptr:
                 char_ptr = ctypes.cast(str_ptr, c_char_p)
                 names.append(char_ptr.value.decode("utf-8"))
-                _lib.tidesdb_free(str_ptr)
+                _tidesdb_free(str_ptr)
 
-        _lib.tidesdb_free(ctypes.cast(names_ptr, c_void_p))
+        _tidesdb_free(names_ptr)
 
         return names
 
@@ -2238,13 +2751,18 @@ class TidesDB:
         if self._closed:
             raise TidesDBError("Database is closed")
 
-        txn_ptr = c_void_p()
-        result = _lib.tidesdb_txn_begin(self._db, ctypes.byref(txn_ptr))
+        out = self._out_params
+        try:
+            txn_ptr = out.txn
+        except AttributeError:
+            txn_ptr = out.txn = c_void_p()
+
+        result = _tidesdb_txn_begin(self._db, txn_ptr)
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to begin transaction")
 
-        return Transaction(txn_ptr)
+        return Transaction(txn_ptr.value)
 
     def begin_txn_with_isolation(self, isolation: IsolationLevel) -> Transaction:
         """
@@ -2259,15 +2777,43 @@ class TidesDB:
         if self._closed:
             raise TidesDBError("Database is closed")
 
-        txn_ptr = c_void_p()
-        result = _lib.tidesdb_txn_begin_with_isolation(
-            self._db, int(isolation), ctypes.byref(txn_ptr)
-        )
+        out = self._out_params
+        try:
+            txn_ptr = out.txn
+        except AttributeError:
+            txn_ptr = out.txn = c_void_p()
+
+        result = _tidesdb_txn_begin_with_isolation(self._db, int(isolation), txn_ptr)
 
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to begin transaction with isolation")
 
-        return Transaction(txn_ptr)
+        return Transaction(txn_ptr.value)
+
+    def put_many(
+        self,
+        cf: ColumnFamily,
+        items: Iterable[tuple[bytes | bytearray | memoryview, bytes | bytearray | memoryview]],
+        ttl: int = -1,
+    ) -> None:
+        """
+        Write many key-value pairs atomically in a single transaction.
+
+        Convenience for bulk loading: begins a transaction, writes every pair
+        with Transaction.put_many() and commits once. If any put or the commit
+        fails, the transaction is rolled back and nothing is written.
+
+        Args:
+            cf: Column family handle
+            items: Iterable of (key, value) pairs as bytes-like objects
+            ttl: Time-to-live applied to every pair, or -1 for no expiration
+
+        Raises:
+            TidesDBError: If any put or the commit fails
+        """
+        with self.begin_txn() as txn:
+            txn.put_many(cf, items, ttl)
+            txn.commit()
 
     def get_cache_stats(self) -> CacheStats:
         """
@@ -2280,7 +2826,7 @@ class TidesDB:
             raise TidesDBError("Database is closed")
 
         c_stats = _CCacheStats()
-        result = _lib.tidesdb_get_cache_stats(self._db, ctypes.byref(c_stats))
+        result = _tidesdb_get_cache_stats(self._db, c_stats)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get cache stats")
 
@@ -2504,7 +3050,7 @@ class TidesDB:
             raise TidesDBError("Database is closed")
 
         c_stats = _CDbStats()
-        result = _lib.tidesdb_get_db_stats(self._db, ctypes.byref(c_stats))
+        result = _tidesdb_get_db_stats(self._db, c_stats)
         if result != TDB_SUCCESS:
             raise TidesDBError.from_code(result, "failed to get database stats")
 
@@ -2605,12 +3151,3 @@ class TidesDB:
     def __exit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: object) -> bool:
         self.close()
         return False
-
-    def __del__(self) -> None:
-        if _lib is None:
-            return
-        if not self._closed:
-            try:
-                self.close()
-            except (TidesDBError, OSError):
-                pass
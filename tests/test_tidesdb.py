@@ -2,42 +2,134 @@
 Tests for TidesDB Python bindings.
 
 These tests require the TidesDB shared library to be installed.
+
+Test databases are created under /dev/shm when it is available so WAL and
+SSTable writes stay in memory; set TIDESDB_TEST_TMPDIR to use another
+directory.
+
+Each pytest-xdist worker gets its own directories and shared database, so the
+suite can run in parallel with ``pytest -n auto``.
 """
 
+import atexit
+import copy
 import os
 import shutil
 import tempfile
+import threading
 import time
+import uuid
 
 import pytest
 
 import tidesdb
 
 
+def _temp_base_dir():
+    """Return the parent directory for test databases (None = system default)."""
+    override = os.environ.get("TIDESDB_TEST_TMPDIR")
+    if override:
+        return override
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+TEMP_BASE_DIR = _temp_base_dir()
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+# Upper bound for flush_memtable(wait=True) so a stalled background job
+# fails the test instead of hanging the run.
+BACKGROUND_TIMEOUT = 30.0
+
+
+def _expect_missing(txn, cf, key):
+    """Assert that key is not visible to txn in cf."""
+    assert txn.try_get(cf, key) is None, f"{key!r} should be missing"
+
+
 @pytest.fixture
 def temp_db_path():
     """Create a temporary directory for test database."""
-    path = tempfile.mkdtemp(prefix="tidesdb_test_")
+    path = tempfile.mkdtemp(prefix=f"tidesdb_test_{WORKER_ID}_", dir=TEMP_BASE_DIR)
     yield path
     shutil.rmtree(path, ignore_errors=True)
 
 
-@pytest.fixture
-def db(temp_db_path):
-    """Create a test database."""
-    database = tidesdb.TidesDB.open(temp_db_path)
+@pytest.fixture(scope="session")
+def db():
+    """Create a test database shared by every test in the session.
+
+    Opening a database starts its flush/compaction threads and allocates the
+    block cache, so the database is opened once and tests isolate their data
+    in column families instead.  Tests that need a database of their own open
+    it on ``temp_db_path``.
+    """
+    path = tempfile.mkdtemp(prefix=f"tidesdb_test_shared_{WORKER_ID}_", dir=TEMP_BASE_DIR)
+    database = tidesdb.TidesDB.open(path)
     yield database
     database.close()
+    if TEMP_BASE_DIR == "/dev/shm":
+        # Nothing else touches the shared directory, so on tmpfs the tree walk is
+        # deferred to interpreter exit instead of being charged to the last test.
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def key_value_corpus():
+    """100 pre-encoded ``key:NNNN`` / ``val:N`` pairs shared by bulk-write tests."""
+    keys = [b"key:%04d" % i for i in range(100)]
+    values = [b"val:%d" % i for i in range(100)]
+    return keys, values
+
+
+@pytest.fixture(scope="session")
+def default_cf_config():
+    """Library default column family config; copy it before mutating."""
+    return tidesdb.default_column_family_config()
+
+
+@pytest.fixture(scope="session")
+def fast_cf_config(default_cf_config):
+    """Default config with WAL syncing off, for tests that don't measure durability."""
+    config = copy.copy(default_cf_config)
+    config.sync_mode = tidesdb.SyncMode.SYNC_NONE
+    return config
+
+
+@pytest.fixture
+def cf_name(db):
+    """Factory for unique column family names in the shared database.
+
+    Every name handed out is dropped at teardown if it still exists, so a test
+    that fails before its own cleanup does not leak into later tests.
+    """
+    names = []
+
+    def make(prefix="cf"):
+        name = f"{prefix}_{uuid.uuid4().hex[:12]}"
+        names.append(name)
+        return name
+
+    yield make
+    for name in names:
+        try:
+            db.drop_column_family(name)
+        except tidesdb.TidesDBError:
+            pass
 
 
 @pytest.fixture
-def cf(db):
-    """Create a test column family."""
-    db.create_column_family("test_cf")
-    cf = db.get_column_family("test_cf")
+def cf(db, fast_cf_config):
+    """Create a uniquely named test column family in the shared database."""
+    name = f"cf_{uuid.uuid4().hex[:12]}"
+    db.create_column_family(name, fast_cf_config)
+    cf = db.get_column_family(name)
     yield cf
     try:
-        db.drop_column_family("test_cf")
+        db.drop_column_family(name)
     except tidesdb.TidesDBError:
         pass
 
@@ -70,43 +162,50 @@ class TestOpenClose:
         with tidesdb.TidesDB.open(temp_db_path) as db:
             assert db is not None
 
+    def test_close_after_finalizer_ran(self, temp_db_path):
+        """Test close() is a no-op once the finalizer has already closed the handle."""
+        db = tidesdb.TidesDB.open(temp_db_path)
+        db._finalizer()  # as at interpreter exit
+        db.close()
+
 
 class TestColumnFamilies:
     """Tests for column family operations."""
 
-    def test_create_drop_column_family(self, db):
+    def test_create_drop_column_family(self, db, cf_name):
         """Test creating and dropping a column family."""
-        db.create_column_family("test_cf")
-        cf = db.get_column_family("test_cf")
+        name = cf_name("test_cf")
+        db.create_column_family(name)
+        cf = db.get_column_family(name)
         assert cf is not None
-        assert cf.name == "test_cf"
-        db.drop_column_family("test_cf")
+        assert cf.name == name
+        db.drop_column_family(name)
 
-    def test_create_with_config(self, db):
+    def test_create_with_config(self, db, cf_name, default_cf_config):
         """Test creating column family with custom config."""
-        config = tidesdb.default_column_family_config()
+        config = copy.copy(default_cf_config)
         config.write_buffer_size = 32 * 1024 * 1024
         config.compression_algorithm = tidesdb.CompressionAlgorithm.LZ4_COMPRESSION
         config.enable_bloom_filter = True
         config.bloom_fpr = 0.01
 
-        db.create_column_family("custom_cf", config)
-        cf = db.get_column_family("custom_cf")
+        name = cf_name("custom_cf")
+        db.create_column_family(name, config)
+        cf = db.get_column_family(name)
         assert cf is not None
 
         stats = cf.get_stats()
         assert stats.config is not None
         assert stats.config.enable_bloom_filter is True
 
-        db.drop_column_family("custom_cf")
-
-    def test_create_with_btree_config(self, db):
+    def test_create_with_btree_config(self, db, cf_name, default_cf_config):
         """Test creating column family with B+tree format enabled."""
-        config = tidesdb.default_column_family_config()
+        config = copy.copy(default_cf_config)
         config.use_btree = True
 
-        db.create_column_family("btree_cf", config)
-        cf = db.get_column_family("btree_cf")
+        name = cf_name("btree_cf")
+        db.create_column_family(name, config)
+        cf = db.get_column_family(name)
         assert cf is not None
 
         stats = cf.get_stats()
@@ -114,24 +213,36 @@ class TestColumnFamilies:
         assert stats.config.use_btree is True
         assert stats.use_btree is True
 
-        db.drop_column_family("btree_cf")
-
     def test_default_config_use_btree(self, db):
         """Test that default config has use_btree=False."""
         config = tidesdb.default_column_family_config()
         assert config.use_btree is False
 
-    def test_list_column_families(self, db):
+    def test_list_column_families(self, db, cf_name):
         """Test listing column families."""
-        db.create_column_family("cf1")
-        db.create_column_family("cf2")
+        name1 = cf_name("cf1")
+        name2 = cf_name("cf2")
+        db.create_column_family(name1)
+        db.create_column_family(name2)
 
         names = db.list_column_families()
-        assert "cf1" in names
-        assert "cf2" in names
+        assert name1 in names
+        assert name2 in names
+
+    def test_list_column_families_repeated(self, db, cf_name):
+        """Test repeated listing, including from another thread, sees current state."""
+        name = cf_name("list_cf")
+        db.create_column_family(name)
+        assert name in db.list_column_families()
 
-        db.drop_column_family("cf1")
-        db.drop_column_family("cf2")
+        results = []
+        worker = threading.Thread(target=lambda: results.append(db.list_column_families()))
+        worker.start()
+        worker.join()
+        assert name in results[0]
+
+        db.drop_column_family(name)
+        assert name not in db.list_column_families()
 
     def test_get_nonexistent_column_family(self, db):
         """Test getting a non-existent column family."""
@@ -152,6 +263,32 @@ class TestTransactions:
             value = txn.get(cf, b"key1")
             assert value == b"value1"
 
+    def test_buffer_keys_and_values(self, db, cf):
+        """Test bytearray and memoryview keys and values round-trip like bytes."""
+        with db.begin_txn() as txn:
+            txn.put(cf, bytearray(b"key1"), bytearray(b"value1"))
+            txn.put(cf, memoryview(b"key2"), memoryview(bytearray(b"value2")))
+            txn.put(cf, memoryview(b"xkey3")[1:], memoryview(b"value3"))
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            assert txn.get(cf, memoryview(b"key1")) == b"value1"
+            assert txn.get(cf, bytearray(b"key2")) == b"value2"
+            assert txn.try_get(cf, b"key3") == b"value3"
+
+            with txn.new_iterator(cf) as it:
+                it.seek(bytearray(b"key2"))
+                assert txn.get(cf, it.key_view()) == b"value2"
+                it.seek_for_prev(memoryview(b"key2"))
+                assert it.key() == b"key2"
+
+        with db.begin_txn() as txn:
+            txn.delete(cf, bytearray(b"key1"))
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            _expect_missing(txn, cf, b"key1")
+
     def test_delete(self, db, cf):
         """Test delete operation."""
         with db.begin_txn() as txn:
@@ -163,8 +300,7 @@ class TestTransactions:
             txn.commit()
 
         with db.begin_txn() as txn:
-            with pytest.raises(tidesdb.TidesDBError):
-                txn.get(cf, b"key1")
+            _expect_missing(txn, cf, b"key1")
 
     def test_rollback(self, db, cf):
         """Test transaction rollback."""
@@ -173,8 +309,66 @@ class TestTransactions:
             txn.rollback()
 
         with db.begin_txn() as txn:
-            with pytest.raises(tidesdb.TidesDBError):
-                txn.get(cf, b"key1")
+            _expect_missing(txn, cf, b"key1")
+
+    def test_try_get(self, db, cf):
+        """Test try_get returns the value, or None for a missing key."""
+        with db.begin_txn() as txn:
+            txn.put(cf, b"key1", b"value1")
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            assert txn.try_get(cf, b"key1") == b"value1"
+            assert txn.try_get(cf, b"missing") is None
+
+    def test_get_into(self, db, cf):
+        """Test get_into copies the value into a caller-provided buffer."""
+        with db.begin_txn() as txn:
+            txn.put(cf, b"key1", b"value1")
+            txn.commit()
+
+        buf = bytearray(16)
+        with db.begin_txn() as txn:
+            n = txn.get_into(cf, b"key1", buf)
+            assert bytes(buf[:n]) == b"value1"
+
+            with pytest.raises(tidesdb.TidesDBError) as excinfo:
+                txn.get_into(cf, b"key1", bytearray(3))
+            assert excinfo.value.code == tidesdb.TDB_ERR_TOO_LARGE
+
+            for readonly in (bytes(16), memoryview(bytearray(16)).toreadonly()):
+                with pytest.raises(TypeError, match="writable"):
+                    txn.get_into(cf, b"key1", readonly)
+
+    def test_concurrent_reads_through_one_transaction(self, db, cf):
+        """Test threads reading through the same transaction each get their own value."""
+        items = [(b"key%d" % i, b"value%d" % i * (i + 1)) for i in range(4)]
+        with db.begin_txn() as txn:
+            txn.put_many(cf, items)
+            txn.commit()
+
+        errors = []
+
+        def reader(txn, key, value):
+            for _ in range(500):
+                if txn.get(cf, key) != value or txn.try_get(cf, key) != value:
+                    errors.append(key)
+                    return
+
+        with db.begin_txn() as txn:
+            threads = [threading.Thread(target=reader, args=(txn, k, v)) for k, v in items]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+
+    def test_get_missing_raises_not_found(self, db, cf):
+        """Test get on a missing key raises with TDB_ERR_NOT_FOUND."""
+        with db.begin_txn() as txn:
+            with pytest.raises(tidesdb.TidesDBError) as excinfo:
+                txn.get(cf, b"missing")
+            assert excinfo.value.code == tidesdb.TDB_ERR_NOT_FOUND
 
     def test_multiple_operations(self, db, cf):
         """Test multiple operations in one transaction."""
@@ -188,8 +382,7 @@ class TestTransactions:
         with db.begin_txn() as txn:
             assert txn.get(cf, b"key1") == b"value1"
             assert txn.get(cf, b"key3") == b"value3"
-            with pytest.raises(tidesdb.TidesDBError):
-                txn.get(cf, b"key2")
+            _expect_missing(txn, cf, b"key2")
 
     def test_isolation_level(self, db, cf):
         """Test transaction with specific isolation level."""
@@ -239,6 +432,37 @@ class TestTransactions:
             txn.single_delete(cf, b"sd_x")
         txn.close()
 
+    def test_put_many_after_commit_raises(self, db, cf):
+        """Test that put_many on a committed transaction raises."""
+        txn = db.begin_txn()
+        txn.commit()
+        with pytest.raises(tidesdb.TidesDBError):
+            txn.put_many(cf, [(b"key1", b"value1")])
+        txn.close()
+
+    @pytest.mark.parametrize("write_path", ["txn_put", "txn_put_many", "db_put_many"])
+    @pytest.mark.parametrize("n", [5, 100, pytest.param(1000, marks=pytest.mark.slow)])
+    def test_batch_put(self, db, cf, write_path, n):
+        """Test writing a batch of keys in a single transaction through each write path."""
+        keys = [b"batch_key_%d" % i for i in range(n)]
+        values = [b"batch_value_%d" % i for i in range(n)]
+        items = list(zip(keys, values, strict=True))
+
+        if write_path == "db_put_many":
+            db.put_many(cf, items)
+        else:
+            with db.begin_txn() as txn:
+                if write_path == "txn_put_many":
+                    txn.put_many(cf, items)
+                else:
+                    for key, value in items:
+                        txn.put(cf, key, value)
+                txn.commit()
+
+        with db.begin_txn() as txn:
+            for key, value in items:
+                assert txn.get(cf, key) == value
+
 
 class TestSavepoints:
     """Tests for savepoint operations."""
@@ -254,8 +478,7 @@ class TestSavepoints:
 
         with db.begin_txn() as txn:
             assert txn.get(cf, b"key1") == b"value1"
-            with pytest.raises(tidesdb.TidesDBError):
-                txn.get(cf, b"key2")
+            _expect_missing(txn, cf, b"key2")
 
     def test_release_savepoint(self, db, cf):
         """Test releasing a savepoint."""
@@ -277,46 +500,142 @@ class TestIterators:
     def test_forward_iteration(self, db, cf):
         """Test forward iteration."""
         with db.begin_txn() as txn:
-            txn.put(cf, b"a", b"1")
-            txn.put(cf, b"b", b"2")
-            txn.put(cf, b"c", b"3")
+            txn.put_many(cf, [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")])
             txn.commit()
 
         with db.begin_txn() as txn:
             with txn.new_iterator(cf) as it:
                 it.seek_to_first()
-                items = list(it)
-                assert len(items) == 3
-                assert items[0] == (b"a", b"1")
-                assert items[1] == (b"b", b"2")
-                assert items[2] == (b"c", b"3")
+                for expected in [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")]:
+                    assert it.valid()
+                    assert (it.key(), it.value()) == expected
+                    it.next()
+                assert not it.valid()
+
+                it.seek_to_first()
+                assert list(it) == [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")]
 
     def test_backward_iteration(self, db, cf):
         """Test backward iteration."""
         with db.begin_txn() as txn:
-            txn.put(cf, b"a", b"1")
-            txn.put(cf, b"b", b"2")
-            txn.put(cf, b"c", b"3")
+            txn.put_many(cf, [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")])
             txn.commit()
 
         with db.begin_txn() as txn:
             with txn.new_iterator(cf) as it:
                 it.seek_to_last()
-                items = []
-                while it.valid():
-                    items.append((it.key(), it.value()))
+                for expected in [(b"c", b"3"), (b"b", b"2"), (b"a", b"1")]:
+                    assert it.valid()
+                    assert (it.key(), it.value()) == expected
                     it.prev()
-                assert len(items) == 3
-                assert items[0] == (b"c", b"3")
-                assert items[1] == (b"b", b"2")
-                assert items[2] == (b"a", b"1")
+                assert not it.valid()
+
+                it.seek_to_first()
+                assert list(it)[::-1] == [(b"c", b"3"), (b"b", b"2"), (b"a", b"1")]
+
+    def test_collect(self, db, cf):
+        """Test collecting all remaining entries in one call."""
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")])
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_first()
+                assert it.collect() == [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")]
+                assert not it.valid()
+                assert it.collect() == []
+
+    def test_collect_limit(self, db, cf):
+        """Test that collect stops after limit entries and can resume."""
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")])
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_first()
+                assert it.collect(limit=2) == [(b"a", b"1"), (b"b", b"2")]
+                assert it.collect(limit=2) == [(b"c", b"3")]
+
+    def test_collect_reverse(self, db, cf):
+        """Test collecting entries backward from the last key."""
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")])
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_last()
+                assert it.collect_reverse(limit=1) == [(b"c", b"3")]
+                assert it.collect_reverse() == [(b"b", b"2"), (b"a", b"1")]
+                assert not it.valid()
+
+    def test_collect_prefix(self, db, cf):
+        """Test collecting only the entries under a key prefix."""
+        db.put_many(
+            cf,
+            [
+                (b"user:1", b"a"),
+                (b"user:2", b"b"),
+                (b"users", b"c"),
+                (b"item:1", b"d"),
+            ],
+        )
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                assert it.collect_prefix(b"user:") == [(b"user:1", b"a"), (b"user:2", b"b")]
+                assert it.collect_prefix(b"user:", limit=1) == [(b"user:1", b"a")]
+                assert it.collect_prefix(b"none:") == []
+                assert it.collect_prefix(b"") == [
+                    (b"item:1", b"d"),
+                    (b"user:1", b"a"),
+                    (b"user:2", b"b"),
+                    (b"users", b"c"),
+                ]
+                assert it.collect_prefix(b"", limit=1) == [(b"item:1", b"d")]
+
+    def test_count(self, db, cf, key_value_corpus):
+        """Test counting entries without reading them."""
+        with db.begin_txn() as txn:
+            txn.put_many(cf, zip(*key_value_corpus, strict=True))
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_first()
+                assert it.count() == len(key_value_corpus[0])
+                assert not it.valid()
+
+                it.seek(b"key:0090")
+                assert it.count() == 10
+
+    def test_key_value_views(self, db, cf):
+        """Test zero-copy key/value views during iteration."""
+        with db.begin_txn() as txn:
+            txn.put(cf, b"a", b"1")
+            txn.put(cf, b"b", b"22")
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_first()
+                seen = []
+                while it.valid():
+                    key_view = it.key_view()
+                    value_view = it.value_view()
+                    assert key_view.readonly
+                    assert key_view == it.key()
+                    assert value_view == it.value()
+                    seen.append((bytes(key_view), bytes(value_view)))
+                    it.next()
+                assert seen == [(b"a", b"1"), (b"b", b"22")]
 
     def test_seek(self, db, cf):
         """Test seek operations."""
         with db.begin_txn() as txn:
-            txn.put(cf, b"a", b"1")
-            txn.put(cf, b"c", b"3")
-            txn.put(cf, b"e", b"5")
+            txn.put_many(cf, [(b"a", b"1"), (b"c", b"3"), (b"e", b"5")])
             txn.commit()
 
         with db.begin_txn() as txn:
@@ -342,7 +661,6 @@ class TestTTL:
             txn.commit()
 
         cf.flush_memtable()
-        time.sleep(2)
 
         with db.begin_txn() as txn:
             try:
@@ -364,33 +682,33 @@ class TestTTL:
 class TestCloneColumnFamily:
     """Tests for column family clone operations."""
 
-    def test_clone_column_family(self, db, cf):
+    def test_clone_column_family(self, db, cf, cf_name):
         """Test cloning a column family with data."""
         with db.begin_txn() as txn:
             txn.put(cf, b"key1", b"value1")
             txn.put(cf, b"key2", b"value2")
             txn.commit()
 
-        db.clone_column_family("test_cf", "cloned_cf")
+        clone_name = cf_name("cloned_cf")
+        db.clone_column_family(cf.name, clone_name)
 
-        cloned = db.get_column_family("cloned_cf")
+        cloned = db.get_column_family(clone_name)
         assert cloned is not None
-        assert cloned.name == "cloned_cf"
+        assert cloned.name == clone_name
 
         with db.begin_txn() as txn:
             assert txn.get(cloned, b"key1") == b"value1"
             assert txn.get(cloned, b"key2") == b"value2"
 
-        db.drop_column_family("cloned_cf")
-
-    def test_clone_independence(self, db, cf):
+    def test_clone_independence(self, db, cf, cf_name):
         """Test that clone is independent from source."""
         with db.begin_txn() as txn:
             txn.put(cf, b"key1", b"original")
             txn.commit()
 
-        db.clone_column_family("test_cf", "cloned_cf")
-        cloned = db.get_column_family("cloned_cf")
+        clone_name = cf_name("cloned_cf")
+        db.clone_column_family(cf.name, clone_name)
+        cloned = db.get_column_family(clone_name)
 
         with db.begin_txn() as txn:
             txn.put(cf, b"key1", b"modified")
@@ -400,29 +718,26 @@ class TestCloneColumnFamily:
             assert txn.get(cloned, b"key1") == b"original"
             assert txn.get(cf, b"key1") == b"modified"
 
-        db.drop_column_family("cloned_cf")
-
-    def test_clone_nonexistent_source(self, db):
+    def test_clone_nonexistent_source(self, db, cf_name):
         """Test cloning a non-existent column family raises error."""
         with pytest.raises(tidesdb.TidesDBError):
-            db.clone_column_family("nonexistent", "cloned_cf")
+            db.clone_column_family("nonexistent", cf_name("cloned_cf"))
 
-    def test_clone_to_existing_name(self, db, cf):
+    def test_clone_to_existing_name(self, db, cf, cf_name):
         """Test cloning to an already existing name raises error."""
-        db.create_column_family("existing_cf")
+        existing = cf_name("existing_cf")
+        db.create_column_family(existing)
         with pytest.raises(tidesdb.TidesDBError):
-            db.clone_column_family("test_cf", "existing_cf")
-        db.drop_column_family("existing_cf")
+            db.clone_column_family(cf.name, existing)
 
-    def test_clone_listed(self, db, cf):
+    def test_clone_listed(self, db, cf, cf_name):
         """Test that cloned column family appears in list."""
-        db.clone_column_family("test_cf", "cloned_cf")
+        clone_name = cf_name("cloned_cf")
+        db.clone_column_family(cf.name, clone_name)
 
         names = db.list_column_families()
-        assert "test_cf" in names
-        assert "cloned_cf" in names
-
-        db.drop_column_family("cloned_cf")
+        assert cf.name in names
+        assert clone_name in names
 
 
 class TestTransactionReset:
@@ -477,12 +792,13 @@ class TestTransactionReset:
             assert txn.get(cf, b"key1") == b"value1"
             assert txn.get(cf, b"key2") == b"value2"
 
-    def test_reset_reuse_loop(self, db, cf):
+    def test_reset_reuse_loop(self, db, cf, key_value_corpus):
         """Test resetting in a loop for batch processing."""
+        keys, values = key_value_corpus
         txn = db.begin_txn()
 
         for i in range(5):
-            txn.put(cf, f"batch_key_{i}".encode(), f"batch_value_{i}".encode())
+            txn.put(cf, keys[i], values[i])
             txn.commit()
             if i < 4:
                 txn.reset(tidesdb.IsolationLevel.READ_COMMITTED)
@@ -491,8 +807,7 @@ class TestTransactionReset:
 
         with db.begin_txn() as txn:
             for i in range(5):
-                value = txn.get(cf, f"batch_key_{i}".encode())
-                assert value == f"batch_value_{i}".encode()
+                assert txn.get(cf, keys[i]) == values[i]
 
     def test_reset_closed_transaction_raises(self, db, cf):
         """Test that resetting a closed transaction raises error."""
@@ -551,23 +866,38 @@ class TestMaintenance:
             txn.put(cf, b"key1", b"value1")
             txn.commit()
 
-        cf.flush_memtable()
-        time.sleep(0.5)
+        cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
+        assert not cf.is_flushing()
+
+    def test_flush_memtable_wait_with_timeout(self, db, cf):
+        """Test that a bounded wait returns once the data has reached an SSTable."""
+        with db.begin_txn() as txn:
+            txn.put(cf, b"key1", b"value1")
+            txn.commit()
 
-    def test_compact(self, db, cf):
+        cf.flush_memtable(wait=True, timeout=10.0)
+        stats = cf.get_stats()
+        assert stats.flush_count >= 1
+        assert sum(stats.level_num_sstables) >= 1
+        with db.begin_txn() as txn:
+            assert txn.get(cf, b"key1") == b"value1"
+
+    def test_compact(self, db, cf, key_value_corpus):
         """Test manual compaction."""
         with db.begin_txn() as txn:
-            for i in range(100):
-                txn.put(cf, f"key{i}".encode(), f"value{i}".encode())
+            txn.put_many(cf, zip(*key_value_corpus, strict=True))
             txn.commit()
 
-        cf.flush_memtable()
-        time.sleep(0.5)
+        cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
         try:
             cf.compact()
         except tidesdb.TidesDBError:
             pass
-        time.sleep(0.5)
+
+        keys, values = key_value_corpus
+        with db.begin_txn() as txn:
+            assert txn.get(cf, keys[0]) == values[0]
+            assert txn.get(cf, keys[-1]) == values[-1]
 
 
 class TestCheckpoint:
@@ -586,7 +916,7 @@ class TestCheckpoint:
             assert os.path.isdir(checkpoint_dir)
 
             with tidesdb.TidesDB.open(checkpoint_dir) as checkpoint_db:
-                cp_cf = checkpoint_db.get_column_family("test_cf")
+                cp_cf = checkpoint_db.get_column_family(cf.name)
                 with checkpoint_db.begin_txn() as txn:
                     assert txn.get(cp_cf, b"key1") == b"value1"
                     assert txn.get(cp_cf, b"key2") == b"value2"
@@ -623,7 +953,7 @@ class TestCheckpoint:
                 txn.commit()
 
             with tidesdb.TidesDB.open(checkpoint_dir) as checkpoint_db:
-                cp_cf = checkpoint_db.get_column_family("test_cf")
+                cp_cf = checkpoint_db.get_column_family(cf.name)
                 with checkpoint_db.begin_txn() as txn:
                     assert txn.get(cp_cf, b"key1") == b"original"
         finally:
@@ -661,11 +991,11 @@ class TestRangeCost:
         cost_ba = cf.range_cost(b"zzz", b"aaa")
         assert cost_ab == cost_ba
 
-    def test_range_cost_narrow_vs_wide(self, db, cf):
+    def test_range_cost_narrow_vs_wide(self, db, cf, key_value_corpus):
         """Test that a wider range costs at least as much as a narrow one."""
+        keys, values = key_value_corpus
         with db.begin_txn() as txn:
-            for i in range(50):
-                txn.put(cf, f"key:{i:04d}".encode(), f"val:{i}".encode())
+            txn.put_many(cf, zip(keys[:50], values[:50], strict=True))
             txn.commit()
 
         narrow = cf.range_cost(b"key:0010", b"key:0015")
@@ -673,15 +1003,14 @@ class TestRangeCost:
         # Wide range should generally cost >= narrow range
         assert wide >= narrow
 
-    def test_range_cost_comparison(self, db, cf):
+    def test_range_cost_comparison(self, db, cf, key_value_corpus):
         """Test comparing costs of different ranges."""
         with db.begin_txn() as txn:
-            for i in range(100):
-                txn.put(cf, f"user:{i:04d}".encode(), f"data:{i}".encode())
+            txn.put_many(cf, zip(*key_value_corpus, strict=True))
             txn.commit()
 
-        cost_a = cf.range_cost(b"user:0000", b"user:0009")
-        cost_b = cf.range_cost(b"user:0000", b"user:0099")
+        cost_a = cf.range_cost(b"key:0000", b"key:0009")
+        cost_b = cf.range_cost(b"key:0000", b"key:0099")
         # Both should be valid floats
         assert isinstance(cost_a, float)
         assert isinstance(cost_b, float)
@@ -690,9 +1019,9 @@ class TestRangeCost:
 class TestLoadConfigFromIni:
     """Tests for loading column family config from INI files."""
 
-    def test_save_and_load_roundtrip(self, temp_db_path):
+    def test_save_and_load_roundtrip(self, temp_db_path, default_cf_config):
         """Test that saving and loading config produces equivalent results."""
-        original = tidesdb.default_column_family_config()
+        original = copy.copy(default_cf_config)
         original.write_buffer_size = 32 * 1024 * 1024
         original.compression_algorithm = tidesdb.CompressionAlgorithm.ZSTD_COMPRESSION
         original.enable_bloom_filter = True
@@ -720,9 +1049,9 @@ class TestLoadConfigFromIni:
         with pytest.raises(tidesdb.TidesDBError):
             tidesdb.load_config_from_ini(ini_path, "my_cf")
 
-    def test_load_preserves_all_fields(self, temp_db_path):
+    def test_load_preserves_all_fields(self, temp_db_path, default_cf_config):
         """Test that all configuration fields survive a save/load roundtrip."""
-        original = tidesdb.default_column_family_config()
+        original = copy.copy(default_cf_config)
         original.level_size_ratio = 8
         original.dividing_level_offset = 3
         original.klog_value_threshold = 1024
@@ -957,21 +1286,23 @@ class TestGetComparator:
 class TestDeleteColumnFamily:
     """Tests for delete_column_family (by pointer) operations."""
 
-    def test_delete_by_pointer(self, db):
+    def test_delete_by_pointer(self, db, cf_name):
         """Test deleting a column family by pointer."""
-        db.create_column_family("del_cf")
-        cf = db.get_column_family("del_cf")
+        name = cf_name("del_cf")
+        db.create_column_family(name)
+        cf = db.get_column_family(name)
         assert cf is not None
 
         db.delete_column_family(cf)
 
         with pytest.raises(tidesdb.TidesDBError):
-            db.get_column_family("del_cf")
+            db.get_column_family(name)
 
-    def test_delete_with_data(self, db):
+    def test_delete_with_data(self, db, cf_name):
         """Test deleting a column family that contains data."""
-        db.create_column_family("data_cf")
-        cf = db.get_column_family("data_cf")
+        name = cf_name("data_cf")
+        db.create_column_family(name)
+        cf = db.get_column_family(name)
 
         with db.begin_txn() as txn:
             txn.put(cf, b"key1", b"value1")
@@ -980,7 +1311,7 @@ class TestDeleteColumnFamily:
         db.delete_column_family(cf)
 
         with pytest.raises(tidesdb.TidesDBError):
-            db.get_column_family("data_cf")
+            db.get_column_family(name)
 
 
 class TestMaxMemoryUsage:
@@ -1011,74 +1342,78 @@ class TestMaxMemoryUsage:
 class TestPurgeCf:
     """Tests for column family purge operations."""
 
-    def test_purge_cf_basic(self, db, cf):
+    def test_purge_cf_basic(self, db, cf, key_value_corpus):
         """Test purging a column family with data."""
+        pairs = list(zip(*key_value_corpus, strict=True))[:50]
         with db.begin_txn() as txn:
-            for i in range(50):
-                txn.put(cf, f"purge_key_{i}".encode(), f"purge_val_{i}".encode())
+            txn.put_many(cf, pairs)
             txn.commit()
 
         cf.purge()
 
         # Data should still be accessible after purge
         with db.begin_txn() as txn:
-            for i in range(50):
-                value = txn.get(cf, f"purge_key_{i}".encode())
-                assert value == f"purge_val_{i}".encode()
+            for key, value in pairs:
+                assert txn.get(cf, key) == value
 
     def test_purge_cf_empty(self, db, cf):
         """Test purging an empty column family succeeds."""
         cf.purge()
 
-    def test_purge_cf_after_deletes(self, db, cf):
+    def test_purge_cf_after_deletes(self, db, cf, key_value_corpus):
         """Test purge after bulk deletes reclaims tombstones."""
+        keys, values = key_value_corpus
         with db.begin_txn() as txn:
-            for i in range(20):
-                txn.put(cf, f"del_key_{i}".encode(), f"del_val_{i}".encode())
+            txn.put_many(cf, zip(keys[:20], values[:20], strict=True))
             txn.commit()
 
         with db.begin_txn() as txn:
-            for i in range(20):
-                txn.delete(cf, f"del_key_{i}".encode())
+            for key in keys[:20]:
+                txn.delete(cf, key)
             txn.commit()
 
         cf.purge()
 
         # Deleted keys should not be found
         with db.begin_txn() as txn:
-            for i in range(20):
+            for key in keys[:20]:
                 with pytest.raises(tidesdb.TidesDBError):
-                    txn.get(cf, f"del_key_{i}".encode())
+                    txn.get(cf, key)
 
 
 class TestPurgeDb:
     """Tests for database-level purge operations."""
 
-    def test_purge_db_basic(self, db):
+    def test_purge_db_basic(self, temp_db_path):
         """Test purging the entire database."""
-        db.create_column_family("purge_cf1")
-        db.create_column_family("purge_cf2")
-        cf1 = db.get_column_family("purge_cf1")
-        cf2 = db.get_column_family("purge_cf2")
-
-        with db.begin_txn() as txn:
-            txn.put(cf1, b"k1", b"v1")
-            txn.put(cf2, b"k2", b"v2")
-            txn.commit()
+        db = tidesdb.TidesDB.open(temp_db_path)
+        try:
+            db.create_column_family("purge_cf1")
+            db.create_column_family("purge_cf2")
+            cf1 = db.get_column_family("purge_cf1")
+            cf2 = db.get_column_family("purge_cf2")
 
-        db.purge()
+            with db.begin_txn() as txn:
+                txn.put(cf1, b"k1", b"v1")
+                txn.put(cf2, b"k2", b"v2")
+                txn.commit()
 
-        # Data should still be accessible
-        with db.begin_txn() as txn:
-            assert txn.get(cf1, b"k1") == b"v1"
-            assert txn.get(cf2, b"k2") == b"v2"
+            db.purge()
 
-        db.drop_column_family("purge_cf1")
-        db.drop_column_family("purge_cf2")
+            # Data should still be accessible
+            with db.begin_txn() as txn:
+                assert txn.get(cf1, b"k1") == b"v1"
+                assert txn.get(cf2, b"k2") == b"v2"
+        finally:
+            db.close()
 
-    def test_purge_db_empty(self, db):
+    def test_purge_db_empty(self, temp_db_path):
         """Test purging a database with no column families succeeds."""
-        db.purge()
+        db = tidesdb.TidesDB.open(temp_db_path)
+        try:
+            db.purge()
+        finally:
+            db.close()
 
 
 class TestSyncWal:
@@ -1100,19 +1435,17 @@ class TestSyncWal:
         """Test syncing WAL on an empty column family."""
         cf.sync_wal()
 
-    def test_sync_wal_after_batch(self, db, cf):
+    def test_sync_wal_after_batch(self, db, cf, key_value_corpus):
         """Test syncing WAL after a batch of writes."""
         with db.begin_txn() as txn:
-            for i in range(100):
-                txn.put(cf, f"batch_{i}".encode(), f"val_{i}".encode())
+            txn.put_many(cf, zip(*key_value_corpus, strict=True))
             txn.commit()
 
         cf.sync_wal()
 
         with db.begin_txn() as txn:
-            for i in range(100):
-                value = txn.get(cf, f"batch_{i}".encode())
-                assert value == f"val_{i}".encode()
+            for key, value in zip(*key_value_corpus, strict=True):
+                assert txn.get(cf, key) == value
 
 
 class TestDbStats:
@@ -1133,11 +1466,11 @@ class TestDbStats:
         stats = db.get_db_stats()
         assert stats.num_column_families >= 1
 
-    def test_db_stats_after_writes(self, db, cf):
+    def test_db_stats_after_writes(self, db, cf, key_value_corpus):
         """Test db stats after writing data."""
+        keys, values = key_value_corpus
         with db.begin_txn() as txn:
-            for i in range(50):
-                txn.put(cf, f"stats_key_{i}".encode(), f"stats_val_{i}".encode())
+            txn.put_many(cf, zip(keys[:50], values[:50], strict=True))
             txn.commit()
 
         stats = db.get_db_stats()
@@ -1152,11 +1485,12 @@ class TestDbStats:
         seen_epoch fencing counters), the C side scribbles past the buffer and
         corrupts the heap, segfaulting on a later commit. Interleave stats reads
         with writes to catch any such ABI drift."""
+        value = b"v" * 64
         for round_ in range(20):
+            items = [(b"heap_%d_%d" % (round_, i), value) for i in range(25)]
             db.get_db_stats()
             with db.begin_txn() as txn:
-                for i in range(25):
-                    txn.put(cf, f"heap_{round_}_{i}".encode(), b"v" * 64)
+                txn.put_many(cf, items)
                 txn.commit()
             db.get_db_stats()
 
@@ -1184,19 +1518,25 @@ class TestDbStats:
         assert stats.primary_epoch == 0
         assert stats.seen_epoch == 0
 
-    def test_db_stats_after_purge(self, db, cf):
+    def test_db_stats_after_purge(self, temp_db_path, key_value_corpus):
         """Test db stats after purging."""
-        with db.begin_txn() as txn:
-            for i in range(20):
-                txn.put(cf, f"purge_stats_{i}".encode(), f"val_{i}".encode())
-            txn.commit()
+        keys, values = key_value_corpus
+        db = tidesdb.TidesDB.open(temp_db_path)
+        try:
+            db.create_column_family("purge_stats_cf")
+            cf = db.get_column_family("purge_stats_cf")
+            with db.begin_txn() as txn:
+                txn.put_many(cf, zip(keys[:20], values[:20], strict=True))
+                txn.commit()
 
-        db.purge()
+            db.purge()
 
-        stats = db.get_db_stats()
-        # After purge, flush and compaction queues should be drained
-        assert stats.flush_queue_size == 0
-        assert stats.compaction_queue_size == 0
+            stats = db.get_db_stats()
+            # After purge, flush and compaction queues should be drained
+            assert stats.flush_queue_size == 0
+            assert stats.compaction_queue_size == 0
+        finally:
+            db.close()
 
 
 class TestUnifiedMemtableConfig:
@@ -1264,14 +1604,15 @@ class TestObjectStoreConfigFields:
         assert config.object_lazy_compaction is False
         assert config.object_prefetch_compaction is True
 
-    def test_cf_config_custom_values(self, db):
+    def test_cf_config_custom_values(self, db, cf_name):
         """Test creating column family with object store config fields set."""
         config = tidesdb.ColumnFamilyConfig(
             object_lazy_compaction=True,
             object_prefetch_compaction=False,
         )
-        db.create_column_family("obj_cf", config)
-        cf = db.get_column_family("obj_cf")
+        name = cf_name("obj_cf")
+        db.create_column_family(name, config)
+        cf = db.get_column_family(name)
 
         with db.begin_txn() as txn:
             txn.put(cf, b"key", b"value")
@@ -1280,8 +1621,6 @@ class TestObjectStoreConfigFields:
         with db.begin_txn() as txn:
             assert txn.get(cf, b"key") == b"value"
 
-        db.drop_column_family("obj_cf")
-
 
 class TestDbStatsNewFields:
     """Tests for new unified memtable and object store fields in DbStats."""
@@ -1390,6 +1729,21 @@ class TestIteratorKeyValue:
                     assert isinstance(k, bytes)
                     assert isinstance(v, bytes)
 
+    def test_next_after_exhaustion(self, db, cf):
+        """Test that next() keeps raising StopIteration once the iterator is exhausted."""
+        with db.begin_txn() as txn:
+            txn.put(cf, b"x", b"1")
+            txn.commit()
+
+        with db.begin_txn() as txn:
+            with txn.new_iterator(cf) as it:
+                it.seek_to_first()
+                assert next(it) == (b"x", b"1")
+                with pytest.raises(StopIteration):
+                    next(it)
+                with pytest.raises(StopIteration):
+                    next(it)
+
 
 class TestObjStoreConfig:
     """Tests for ObjStoreConfig and related functions."""
@@ -1543,27 +1897,22 @@ class TestTombstoneConfig:
         assert cfg.tombstone_density_trigger == 0.0
         assert cfg.tombstone_density_min_entries == 1024
 
-    def test_roundtrip_through_get_stats(self, db):
+    def test_roundtrip_through_get_stats(self, db, cf_name, default_cf_config):
         """Custom tombstone settings must round-trip via get_stats().config."""
-        cfg = tidesdb.default_column_family_config()
+        cfg = copy.copy(default_cf_config)
         cfg.tombstone_density_trigger = 0.5
         cfg.tombstone_density_min_entries = 256
-        db.create_column_family("tomb_cf", cfg)
-        try:
-            cf = db.get_column_family("tomb_cf")
-            stats = cf.get_stats()
-            assert stats.config is not None
-            assert stats.config.tombstone_density_trigger == 0.5
-            assert stats.config.tombstone_density_min_entries == 256
-        finally:
-            try:
-                db.drop_column_family("tomb_cf")
-            except tidesdb.TidesDBError:
-                pass
+        name = cf_name("tomb_cf")
+        db.create_column_family(name, cfg)
+        cf = db.get_column_family(name)
+        stats = cf.get_stats()
+        assert stats.config is not None
+        assert stats.config.tombstone_density_trigger == 0.5
+        assert stats.config.tombstone_density_min_entries == 256
 
-    def test_ini_roundtrip(self, temp_db_path):
+    def test_ini_roundtrip(self, temp_db_path, default_cf_config):
         """Tombstone settings must round-trip through INI save/load."""
-        original = tidesdb.default_column_family_config()
+        original = copy.copy(default_cf_config)
         original.tombstone_density_trigger = 0.75
         original.tombstone_density_min_entries = 2048
 
@@ -1580,21 +1929,19 @@ class TestTombstoneStats:
     def test_tombstone_stats_populated(self, db, cf):
         """After flushing some deletes, tombstone stats should be sensible."""
         n = 200
+        keys = [b"k%04d" % i for i in range(n)]
         with db.begin_txn() as txn:
-            for i in range(n):
-                txn.put(cf, f"k{i:04d}".encode(), f"v{i}".encode())
+            txn.put_many(cf, [(key, b"v%d" % i) for i, key in enumerate(keys)])
             txn.commit()
 
-        cf.flush_memtable()
-        time.sleep(0.5)
+        cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
 
         with db.begin_txn() as txn:
-            for i in range(n // 2):
-                txn.delete(cf, f"k{i:04d}".encode())
+            for key in keys[: n // 2]:
+                txn.delete(cf, key)
             txn.commit()
 
-        cf.flush_memtable()
-        time.sleep(0.5)
+        cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
 
         stats = cf.get_stats()
         assert stats.total_tombstones >= 0
@@ -1620,14 +1967,13 @@ class TestCompactRange:
 
     def test_compact_range_narrow(self, db, cf):
         """compact_range over a narrow range should succeed and not affect outside data."""
+        value = b"v" * 32
         for batch in range(3):
+            items = [(b"key:%02d:%04d" % (batch, i), value) for i in range(50)]
             with db.begin_txn() as txn:
-                for i in range(50):
-                    key = f"key:{batch:02d}:{i:04d}".encode()
-                    txn.put(cf, key, b"v" * 32)
+                txn.put_many(cf, items)
                 txn.commit()
-            cf.flush_memtable()
-            time.sleep(0.3)
+            cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
 
         cf.compact_range(b"key:01:0010", b"key:01:0020")
 
@@ -1638,11 +1984,9 @@ class TestCompactRange:
     def test_compact_range_unbounded_start(self, db, cf):
         """None start means unbounded on the lower side."""
         with db.begin_txn() as txn:
-            for i in range(20):
-                txn.put(cf, f"k{i:03d}".encode(), b"value")
+            txn.put_many(cf, [(b"k%03d" % i, b"value") for i in range(20)])
             txn.commit()
-        cf.flush_memtable()
-        time.sleep(0.3)
+        cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
 
         cf.compact_range(None, b"k010")
 
@@ -1689,8 +2033,7 @@ class TestMaxConcurrentFlushes:
             with db.begin_txn() as txn:
                 txn.put(cf, b"k", b"v")
                 txn.commit()
-            cf.flush_memtable()
-            time.sleep(0.3)
+            cf.flush_memtable(wait=True, timeout=BACKGROUND_TIMEOUT)
             with db.begin_txn() as txn:
                 assert txn.get(cf, b"k") == b"v"
         finally:
@@ -1706,11 +2049,37 @@ class TestCompressionAvailable:
             tidesdb.CompressionAlgorithm.NO_COMPRESSION
         ) is True
 
-    def test_returns_bool_for_each_algorithm(self):
+    @pytest.mark.parametrize("algo", list(tidesdb.CompressionAlgorithm), ids=lambda a: a.name)
+    def test_returns_bool_for_each_algorithm(self, algo):
         """Every algorithm enum returns a plain bool without raising."""
-        for algo in tidesdb.CompressionAlgorithm:
-            result = tidesdb.compression_available(algo)
-            assert isinstance(result, bool)
+        assert isinstance(tidesdb.compression_available(algo), bool)
+
+
+class TestChooseCompression:
+    """Tests for the choose_compression() helper."""
+
+    @pytest.mark.parametrize("target", ["fastest", "balanced", "ratio"])
+    def test_returns_available_algorithm(self, target):
+        """The chosen algorithm is always one this build supports."""
+        algo = tidesdb.choose_compression(target)
+        assert isinstance(algo, tidesdb.CompressionAlgorithm)
+        assert tidesdb.compression_available(algo)
+
+    def test_unknown_target_raises(self):
+        """An unknown target is rejected rather than silently defaulted."""
+        with pytest.raises(ValueError):
+            tidesdb.choose_compression("smallest")
+
+
+class TestCapiAddresses:
+    """Tests for the exported C entry point addresses."""
+
+    def test_addresses_are_resolved(self):
+        """Each data-path entry point maps to a distinct non-null address."""
+        capi = tidesdb.TIDESDB_CAPI
+        assert {"tidesdb_txn_put", "tidesdb_iter_next", "tidesdb_free"} <= capi.keys()
+        assert all(isinstance(address, int) and address for address in capi.values())
+        assert len(set(capi.values())) == len(capi)
 
 
 class TestRaiseOpenFileLimit:
@@ -1761,10 +2130,9 @@ class TestCancelBackgroundWork:
         db = tidesdb.TidesDB.open(temp_db_path)
         db.create_column_family("cancel_cf")
         cf = db.get_column_family("cancel_cf")
-        for i in range(50):
-            with db.begin_txn() as txn:
-                txn.put(cf, f"key{i}".encode(), b"value")
-                txn.commit()
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"key%d" % i, b"value") for i in range(50)])
+            txn.commit()
         cf.flush_memtable()
         db.cancel_background_work()
         db.close()
@@ -1799,10 +2167,9 @@ class TestFinishCompactionsOnClose:
         )
         db.create_column_family("fc_cf")
         cf = db.get_column_family("fc_cf")
-        for i in range(20):
-            with db.begin_txn() as txn:
-                txn.put(cf, f"k{i}".encode(), b"v")
-                txn.commit()
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"k%d" % i, b"v") for i in range(20)])
+            txn.commit()
         cf.flush_memtable()
         db.close()
 
@@ -1818,13 +2185,10 @@ class TestFinishCompactionsOnClose:
 class TestWriteAmplificationStats:
     """Tests for the write-amplification counters on Stats and DbStats."""
 
-    def test_cf_stats_have_wa_fields(self, db):
-        db.create_column_family("wa_cf")
-        cf = db.get_column_family("wa_cf")
-        for i in range(100):
-            with db.begin_txn() as txn:
-                txn.put(cf, f"key{i:04d}".encode(), b"x" * 64)
-                txn.commit()
+    def test_cf_stats_have_wa_fields(self, db, cf):
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"key%04d" % i, b"x" * 64) for i in range(100)])
+            txn.commit()
         cf.purge()
         stats = cf.get_stats()
         for field in (
@@ -1842,13 +2206,10 @@ class TestWriteAmplificationStats:
         # Committing 100 KV pairs must register some logical user bytes.
         assert stats.user_bytes_written > 0
 
-    def test_db_stats_have_wa_fields(self, db):
-        db.create_column_family("wa_db_cf")
-        cf = db.get_column_family("wa_db_cf")
-        for i in range(50):
-            with db.begin_txn() as txn:
-                txn.put(cf, f"k{i}".encode(), b"value")
-                txn.commit()
+    def test_db_stats_have_wa_fields(self, db, cf):
+        with db.begin_txn() as txn:
+            txn.put_many(cf, [(b"k%d" % i, b"value") for i in range(50)])
+            txn.commit()
         stats = db.get_db_stats()
         for field in (
             "uwal_bytes_written",
@@ -1916,4 +2277,11 @@ class TestBusyErrorCode:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    args = [__file__, "-v"]
+    try:
+        import xdist  # noqa: F401
+
+        args += ["-n", "auto"]
+    except ImportError:
+        pass
+    pytest.main(args)